@@ -2,6 +2,7 @@
 import sqlite3
 from flask import Flask, jsonify, request # type: ignore
 from flask_cors import CORS   # type: ignore
+from bookmarks_store import bookmark_row, ensure_normalized_columns
 
 app = Flask(__name__)
 CORS(app)
@@ -15,6 +16,7 @@ def init_db():
                  title TEXT,
                  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)''')
     conn.commit()
+    ensure_normalized_columns(conn)
     conn.close()
 
 
@@ -35,8 +37,8 @@ def handle_bookmarks():
     elif request.method == 'POST':
         data = request.json
         try:
-            c.execute("INSERT INTO bookmarks (url, title) VALUES (?, ?)",
-                     (data['url'], data.get('title', '')))
+            c.execute("INSERT INTO bookmarks (title, url, normalized_title, domain) VALUES (?, ?, ?, ?)",
+                     bookmark_row(data.get('title', ''), data['url']))
             conn.commit()
             return jsonify({'message': 'Bookmark saved'}), 201
         except sqlite3.IntegrityError:
@@ -2,18 +2,58 @@
 from flask import Flask, jsonify, request
 from flask_cors import CORS
 import sqlite3
-from serpapi import GoogleSearch
 import os
+import time
+import threading
+import concurrent.futures
 from dotenv import load_dotenv
+from serp_cache import RateLimiter, SerpCache, serpapi_backend, DEFAULT_TTL
+from resource_refresher import ResourceRefresher
+from bookmark_normalizer import normalize_title
+from bookmarks_store import add_missing_columns, ensure_normalized_columns
 load_dotenv()
 
 SERP_API_KEY = os.getenv("SERP_API_KEY")
+# Another SerpAPI-compatible server to query instead of serpapi.com, e.g. fake_serpapi.py
+SERPAPI_BACKEND = os.getenv("SERPAPI_BACKEND")
+SERP_CACHE_PATH = os.getenv("SERP_CACHE_PATH", "serp_cache.db")
+SERP_CACHE_TTL = float(os.getenv("SERP_CACHE_TTL_HOURS", DEFAULT_TTL / 3600)) * 3600
+SERPAPI_MAX_RPS = float(os.getenv("SERPAPI_MAX_RPS", 5))  # Live searches per second, across all requests
+ENRICH_WORKERS = int(os.getenv("ENRICH_WORKERS", 8))  # Searches in flight at once
+# Resources of a cleaned title are searched again once they are older than this
+RESOURCES_TTL = float(os.getenv("RESOURCES_TTL_HOURS", SERP_CACHE_TTL / 3600)) * 3600
+MAX_REFRESH_WAIT = 30  # Longest a /resources_refresh_status long poll is held, in seconds
+TITLE_LOOKUP_CHUNK = 500  # Titles per "WHERE title IN (...)" query, below SQLite's variable limit
+
+# Created on first use, so importing this module opens no database and starts no threads
+_serp_cache = None
+_enrich_executor = None
+_lazy_lock = threading.Lock()
+
+def get_serp_cache():
+    """Identical queries within the TTL are answered from SQLite instead of a new search"""
+    global _serp_cache
+    with _lazy_lock:
+        if _serp_cache is None:
+            _serp_cache = SerpCache(SERP_CACHE_PATH, ttl=SERP_CACHE_TTL, backend=serpapi_backend(SERPAPI_BACKEND),
+                                    rate_limiter=RateLimiter(SERPAPI_MAX_RPS))
+        return _serp_cache
+
+def get_enrich_executor():
+    """Shared by all requests, so concurrent enrichment runs stay within ENRICH_WORKERS searches"""
+    global _enrich_executor
+    with _lazy_lock:
+        if _enrich_executor is None:
+            _enrich_executor = concurrent.futures.ThreadPoolExecutor(max_workers=ENRICH_WORKERS)
+        return _enrich_executor
 
 app = Flask(__name__)
 # Configure CORS to allow credentials
 CORS(app, resources={r"/*": {
     "origins": ["http://localhost:5173", "http://127.0.0.1:5173"], 
-    "supports_credentials": True
+    "supports_credentials": True,
+    # The dashboard reads this to long-poll /resources_refresh_status
+    "expose_headers": ["X-Resources-Version"]
 }})
 
 def init_db():
@@ -21,83 +61,72 @@ def init_db():
     conn.row_factory = sqlite3.Row
     return conn
 
-def get_all_bookmark_titles():
-    conn = init_db()
+def cleaned_title(row):
+    """
+    A bookmark row's cleaned title: normalized_title, stored when the bookmark is
+    saved, or computed here for rows not written through bookmark_row (or not yet
+    backfilled). May be empty for titles that are all job-board noise.
+    """
+    return row["normalized_title"] if row["normalized_title"] is not None else normalize_title(row["title"])
+
+def get_all_bookmark_titles(conn):
     cursor = conn.cursor()
-    cursor.execute("SELECT title FROM bookmarks")
+    cursor.execute("SELECT title, normalized_title FROM bookmarks")
     rows = cursor.fetchall()
-    conn.close()
-    return [row["title"] for row in rows]
-
-import re
-
-def clean_title(raw_title):
-    # Lowercase for uniformity
-    title = raw_title.lower()
-    
-    # Remove common suffixes like location, job boards, etc.
-    title = re.sub(r'\|.*', '', title)            # Remove anything after '|'
-    title = re.sub(r'-\s*(bangalore|gurgaon|remote|india).*', '', title)  # Remove location
-    title = re.sub(r'(at|by)\s+[\w\s,.]+', '', title)  # Remove 'at CompanyName'
-    title = re.sub(r'\b(internship|full[- ]?time|work from home)\b', '', title)
-    title = re.sub(r'\b(unstop|indeed|naukri|linkedin|sarjapura)\b', '', title)
-    
-    # Remove extra punctuation and whitespace
-    title = re.sub(r'[^a-z\s]', '', title)
-    title = re.sub(r'\s+', ' ', title).strip()
+    return [cleaned_title(row) for row in rows]
 
-    # Capitalize for final look
-    return title.title()
+class SearchError(Exception):
+    """SerpAPI answered with an error (bad key, quota) instead of results."""
 
 
-def fetch_links_for_job(job_title):
-    try:
-        query = f"{job_title} site:leetcode.com OR site:theforage.com"
-        print("[QUERY] LeetCode/FORAGE:", query)
-
-        search = GoogleSearch({
-            "q": query,
-            "api_key": SERP_API_KEY,
-            "num": 5
-        })
+def search(params, max_age=None):
+    """SerpCache.search() that raises SearchError for error responses"""
+    results = get_serp_cache().search(params, max_age)
+    if "error" in results:
+        raise SearchError(results["error"])
+    return results
 
-        results = search.get_dict()
-        print("[RESULTS RAW]", results)
+# Both searches raise on failure, so a failed search is never stored as "no resources"
+def fetch_links_for_job(job_title, max_age=None):
+    query = f"{job_title} site:leetcode.com OR site:theforage.com"
+    print("[QUERY] LeetCode/FORAGE:", query)
 
-        links = results.get("organic_results", [])
-        print(f"[FOUND {len(links)} RESULTS]")
+    results = search({
+        "engine": "google",
+        "q": query,
+        "api_key": SERP_API_KEY,
+        "num": 5
+    }, max_age)
+    print("[RESULTS RAW]", results)
 
-        leetcode_links = []
-        forage_links = []
+    links = results.get("organic_results", [])
+    print(f"[FOUND {len(links)} RESULTS]")
 
-        for item in links:
-            link = item.get("link")
-            title = item.get("title")
-            print(f"→ {title}: {link}")
-            if "leetcode.com" in link:
-                leetcode_links.append({"title": title, "link": link})
-            elif "theforage.com" in link:
-                forage_links.append({"title": title, "link": link})
+    leetcode_links = []
+    forage_links = []
 
-        return {
-            "leetcode": leetcode_links,
-            "forage": forage_links
-        }
+    for item in links:
+        link = item.get("link") or ""
+        title = item.get("title")
+        print(f"→ {title}: {link}")
+        if "leetcode.com" in link:
+            leetcode_links.append({"title": title, "link": link})
+        elif "theforage.com" in link:
+            forage_links.append({"title": title, "link": link})
 
-    except Exception as e:
-        print(f"[ERROR] While fetching LeetCode/Forage: {e}")
-        return {"leetcode": [], "forage": []}
+    return {
+        "leetcode": leetcode_links,
+        "forage": forage_links
+    }
 
 
-def fetch_learning_resources(job_title):
-    search = GoogleSearch({
+def fetch_learning_resources(job_title, max_age=None):
+    results = search({
         "engine": "google",
         "q": f"{job_title} marketing resources OR courses OR certifications",
         "api_key": SERP_API_KEY,
         "num": 10  # Number of results to fetch
-    })
-
-    results = search.get_dict()
+    }, max_age)
     organic_results = results.get("organic_results", [])
 
     return [
@@ -106,91 +135,235 @@ def fetch_learning_resources(job_title):
     ]
     
 def ensure_resources_column():
+    """
+    Create the title_resources table: resources stored once per cleaned title, which
+    bookmarks reach through their normalized_title. Resources saved per bookmark by
+    older versions are copied over, marked stale so they get refreshed.
+    """
     conn = init_db()
+    ensure_normalized_columns(conn)
+    has_bookmarks = add_missing_columns(conn, [("resources", "TEXT")])  # Legacy per-bookmark resources
     cursor = conn.cursor()
-    try:
-        cursor.execute("ALTER TABLE bookmarks ADD COLUMN resources TEXT")
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass  # Column already exists
+    existing = {row["name"] for row in cursor.execute("PRAGMA table_info(bookmarks)")}
+    with conn:
+        if "resource_title" in existing:
+            # Earlier link column, always equal to normalized_title
+            try:
+                cursor.execute("ALTER TABLE bookmarks DROP COLUMN resource_title")
+            except sqlite3.OperationalError:
+                pass  # SQLite before 3.35; the column is simply no longer used
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS title_resources (
+                title TEXT PRIMARY KEY,
+                resources TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+
+        # Titles that already have a row keep it, so repeating this is harmless
+        if has_bookmarks:
+            cursor.execute('''
+                INSERT OR IGNORE INTO title_resources (title, resources, fetched_at)
+                SELECT normalized_title, resources, 0 FROM bookmarks
+                WHERE resources IS NOT NULL AND normalized_title IS NOT NULL
+            ''')
+            if cursor.rowcount > 0:
+                print(f"Moved resources of {cursor.rowcount} titles into title_resources")
     conn.close()
 
 import json
 
-def save_resources_to_db(title, resources_dict):
+def get_stored_title_resources(conn, titles):
+    """
+    Stored {"resources", "fetched_at"} of the given cleaned titles, however old.
+    Rows whose resources cannot be decoded are left out, as if nothing was stored.
+    """
+    titles = list(titles)
+    stored = {}
+    for start in range(0, len(titles), TITLE_LOOKUP_CHUNK):
+        chunk = titles[start:start + TITLE_LOOKUP_CHUNK]
+        cursor = conn.execute(
+            f"SELECT title, resources, fetched_at FROM title_resources WHERE title IN ({','.join('?' * len(chunk))})",
+            chunk
+        )
+        for row in cursor:
+            entry = decode_stored_resources(row["title"], row)
+            if entry is not None:
+                stored[row["title"]] = entry
+    return stored
+
+def decode_stored_resources(title, row):
+    """{"resources", "fetched_at"} from a row's resources/fetched_at, or None if nothing usable is stored."""
+    if row["resources"] is None:
+        return None
+    try:
+        return {"resources": json.loads(row["resources"]), "fetched_at": row["fetched_at"]}
+    except json.JSONDecodeError:
+        print(f"[ERROR] Stored resources for {title!r} are not valid JSON; searching again")
+        return None
+
+def save_resources_to_db(resources_by_title):
+    """
+    Store resources (as JSON) once per cleaned title, all in a single transaction.
+    Only pass titles whose searches succeeded; a title left out keeps its stored row.
+    """
+    fetched_at = time.time()
     conn = init_db()
-    cursor = conn.cursor()
-    
-    # Convert dict to JSON string
-    resources_json = json.dumps(resources_dict)
-
-    # Store it under the correct title
-    cursor.execute("UPDATE bookmarks SET resources = ? WHERE title = ?", (resources_json, title))
-    conn.commit()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO title_resources (title, resources, fetched_at) VALUES (?, ?, ?)",
+            [(title, json.dumps(resources), fetched_at) for title, resources in resources_by_title.items()]
+        )
     conn.close()
     
-# Modify your /resources_from_db endpoint to ensure it returns proper data
+# Answers at once from what is stored; missing and expired titles are refreshed in the background
 @app.route("/resources_from_db", methods=["GET"])
 def get_resources_from_db():
     print("THIS WORKSSSSSSSSSSSSSSSS")
     conn = init_db()
     cursor = conn.cursor()
-    cursor.execute("SELECT title, resources FROM bookmarks WHERE resources IS NOT NULL")
-    rows = cursor.fetchall()
+    cursor.execute('''
+        SELECT b.title, b.normalized_title, tr.resources, tr.fetched_at
+        FROM bookmarks b
+        LEFT JOIN title_resources tr ON tr.title = b.normalized_title
+    ''')
+    bookmarks = cursor.fetchall()
+    # Rows without a normalized_title found nothing to join; look their cleaned titles up directly
+    unjoined = get_stored_title_resources(
+        conn, {cleaned_title(row) for row in bookmarks if row["normalized_title"] is None}
+    )
     conn.close()
 
-    if not rows:  # If no resources exist, fetch them
-        fetch_resources_for_all_bookmarks()
-        return get_resources_from_db()  # Recursively call self after fetching
-
+    # Read before queueing, so a client waiting on this version sees the refresh it triggered
+    version = resource_refresher.version
+    cutoff = time.time() - RESOURCES_TTL
     resource_data = []
-    for row in rows:
-        try:
-            resources = json.loads(row["resources"]) if row["resources"] else {}
-            resource_data.append({
-                "title": row["title"],
-                "resources": resources
-            })
-        except json.JSONDecodeError:
-            continue
-
-    return jsonify(resource_data)
-
+    to_refresh = []
+    for row in bookmarks:
+        title = cleaned_title(row)
+        if row["normalized_title"] is None:
+            entry = unjoined.get(title)
+        else:
+            entry = decode_stored_resources(title, row)
+        resources = {}
+        status = "missing"
+        if entry is not None:
+            resources = entry["resources"]
+            status = "fresh" if entry["fetched_at"] > cutoff else "stale"
+        if status != "fresh" and title:
+            to_refresh.append(title)
+
+        resource_data.append({
+            "title": row["title"],
+            "resources": resources,
+            "status": status
+        })
 
+    resource_refresher.enqueue(to_refresh)
+    response = jsonify(resource_data)
+    # Pass as ?since= to /resources_refresh_status to wait for the refresh
+    response.headers["X-Resources-Version"] = str(version)
+    return response
+
+@app.route("/resources_refresh_status", methods=["GET"])
+def get_resources_refresh_status():
+    """
+    Background refresh progress. With ?since=<X-Resources-Version>&wait=<seconds> the
+    request is held until a refresh batch finishes or nothing is left to refresh.
+    """
+    since = request.args.get("since", type=int)
+    if since is None:
+        return jsonify(resource_refresher.status())
+    wait = min(request.args.get("wait", default=MAX_REFRESH_WAIT, type=float), MAX_REFRESH_WAIT)
+    return jsonify(resource_refresher.wait(since, wait))
 
 @app.route("/")
 def home():
     return "This is for resource Recommendation!"
 
+def enrich_titles(titles, max_age=None):
+    """
+    Run both searches for every cleaned title on the shared pool; live searches are
+    capped at SERPAPI_MAX_RPS. Returns {title: resources} in input order; a title
+    is only included when both of its searches succeeded, failures are logged.
+    """
+    enrich_executor = get_enrich_executor()
+    jobs = [
+        (
+            title,
+            enrich_executor.submit(fetch_links_for_job, title, max_age),
+            enrich_executor.submit(fetch_learning_resources, title, max_age),
+        )
+        for title in titles
+    ]
+
+    enriched = {}
+    for title, leet_forage, general in jobs:
+        try:
+            enriched[title] = {
+                **leet_forage.result(),
+                "General": general.result()
+            }
+        except Exception as e:
+            print(f"[ERROR] While fetching resources for {title!r}: {e}")
+    return enriched
+
+def refresh_title_resources(titles):
+    """
+    Search resources for cleaned titles and store the ones that succeeded. Failed titles
+    keep their stored (stale) resources and are returned, so the background refresher
+    retries them later.
+    """
+    enriched = enrich_titles(titles)
+    save_resources_to_db(enriched)
+    return [title for title in titles if title not in enriched]
+
+resource_refresher = ResourceRefresher(refresh_title_resources)
+
 @app.route("/resources_for_all_bookmarks", methods=["GET"])
 def fetch_resources_for_all_bookmarks():
-    titles = get_all_bookmark_titles()
-    enriched_data = []
+    # Many raw titles (the same role on several job boards) share one cleaned title
+    conn = init_db()
+    bookmark_titles = get_all_bookmark_titles(conn)
+    titles = [title for title in dict.fromkeys(bookmark_titles) if title]
+
+    # ?refresh=1 searches every title again, bypassing stored resources and cached search results
+    refresh = request.args.get("refresh") == "1"
+    stored = get_stored_title_resources(conn, titles)
+    conn.close()
+    cutoff = time.time() - RESOURCES_TTL
+    fresh = {} if refresh else {title: entry for title, entry in stored.items() if entry["fetched_at"] > cutoff}
     
     print("THIS ALSOOOOOOOOOOOO")
+    print(f"{len(bookmark_titles)} bookmarks, {len(titles)} distinct titles, {len(fresh)} still fresh")
 
-    for raw_title in titles:
-        title = clean_title(raw_title)
-        leet_forage = fetch_links_for_job(title)
-        General = fetch_learning_resources(title)
-
-        combined_resources = {
-            **leet_forage,
-            "General": General
-        }
+    to_search = [title for title in titles if title not in fresh]
+    enriched = enrich_titles(to_search, 0 if refresh else None)
+    if len(enriched) < len(to_search):
+        print(f"{len(to_search) - len(enriched)} titles failed and keep their stored resources")
 
-        # Save to DB
-        save_resources_to_db(raw_title, combined_resources) 
+    # Save to DB, all titles in one transaction
+    save_resources_to_db(enriched)
 
-        # Also keep it for the response
-        enriched_data.append({
+    # Also keep it for the response; titles whose search failed show what is stored, if anything
+    enriched_data = [
+        {
             "job_title": title,
-            "resources": combined_resources
-        })
+            "resources": enriched[title] if title in enriched else stored.get(title, {}).get("resources", {})
+        }
+        for title in titles
+    ]
 
     return jsonify(enriched_data)
 
+@app.route("/serp_cache_stats", methods=["GET"])
+def get_serp_cache_stats():
+    return jsonify(get_serp_cache().stats())
+
 
 if __name__ == "__main__":
     ensure_resources_column()  # this must be run at least once to create the 'resources' column
+    evicted = get_serp_cache().evict()  # Later evictions happen as new searches are cached
+    if evicted:
+        print(f"Evicted {evicted} expired search results from the cache")
     app.run(debug=True, port=5003)
\ No newline at end of file
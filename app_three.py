@@ -1,159 +1,134 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Request, jsonify, request
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import io
 import os
 from datetime import datetime
 import traceback
-import re
-import PyPDF2  # For PDF parsing
+from collections import Counter
 import docx  # For DOCX parsing
-import nltk
-from nltk.tokenize import word_tokenize
-from nltk.corpus import stopwords
-
-# Download NLTK resources (run once)
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
-app = Flask(__name__)
-CORS(app, supports_credentials=True, resources={
-    r"/*": {"origins": "*"}  # Open CORS for all routes
-})
+from resume_cache import get_resume_cache, file_sha256, sha256_bytes
+from pdf_text import extract_pdf_text
+from taxonomy import get_taxonomy, reload_taxonomy
+from resume_jobs import ResumeJobQueue, QueueFullError
+from skill_index import JobSkillIndex
 
 # Constants
-DOWNLOAD_FOLDER = "downloads"
 MAX_RESUME_SIZE = 5 * 1024 * 1024  # 5MB
+MULTIPART_OVERHEAD = 64 * 1024  # Room for the multipart headers and boundaries around the file
 ALLOWED_EXTENSIONS = {'.pdf', '.doc', '.docx'}
 MIN_SKILLS_THRESHOLD = 3  # Minimum number of skills to consider extraction successful
+RESUME_CACHE_NAMESPACE = "app_three"  # Separates our PyPDF2/docx text from skill_gap's pdfplumber text
+ANALYSIS_WORKERS = 2  # Processes parsing resumes submitted to /analyze_resume/jobs
+MAX_PENDING_ANALYSES = 16  # Further submissions get a 429 until the queue drains
+MATCH_THRESHOLD = 70.0  # A bookmarked job counts as matched at this match percentage or above
+TOP_MISSING_SKILLS = 3  # Missing skills called out in the recommendations
+LOCAL_ADDRESSES = {"127.0.0.1", "::1"}  # Only these may trigger POST /taxonomy/reload
 
-# Ensure download folder exists
-os.makedirs(DOWNLOAD_FOLDER, exist_ok=True)
+# Skills of the bookmarked jobs, rebuilt only when bookmarks.db changes
+JOB_SKILL_INDEX = JobSkillIndex()
 
-# Technical skills database (expand as needed)
-TECHNICAL_SKILLS = {
-    'programming_languages': [
-        'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'php', 'swift',
-        'kotlin', 'go', 'rust', 'scala', 'perl', 'r', 'matlab', 'bash', 'powershell'
-    ],
-    'web_technologies': [
-        'html', 'css', 'react', 'angular', 'vue', 'node.js', 'express', 'django', 'flask',
-        'spring', 'bootstrap', 'jquery', 'sass', 'less', 'webpack', 'graphql', 'rest', 'json',
-        'xml', 'nextjs', 'svelte', 'tailwind'
-    ],
-    'databases': [
-        'sql', 'mysql', 'postgresql', 'mongodb', 'oracle', 'sqlite', 'redis', 'cassandra',
-        'dynamodb', 'firebase', 'neo4j', 'elasticsearch', 'couchdb', 'mariadb'
-    ],
-    'cloud_and_devops': [
-        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'jenkins', 'gitlab', 'github actions',
-        'terraform', 'ansible', 'chef', 'puppet', 'prometheus', 'grafana', 'ci/cd', 'serverless'
-    ],
-    'ai_and_data': [
-        'machine learning', 'deep learning', 'tensorflow', 'pytorch', 'scikit-learn', 'pandas',
-        'numpy', 'matplotlib', 'seaborn', 'tableau', 'power bi', 'nlp', 'computer vision',
-        'data mining', 'data analysis', 'big data', 'hadoop', 'spark', 'keras', 'opencv'
-    ]
-}
+class InMemoryUploadRequest(Request):
+    """Keeps uploaded files in memory instead of spilling them to temporary files."""
 
-# Soft skills database
-SOFT_SKILLS = [
-    'communication', 'teamwork', 'leadership', 'problem solving', 'time management',
-    'critical thinking', 'adaptability', 'creativity', 'emotional intelligence',
-    'conflict resolution', 'project management', 'decision making', 'negotiation',
-    'presentation', 'public speaking', 'attention to detail', 'customer service'
-]
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # MAX_CONTENT_LENGTH bounds the whole body, so the buffer never exceeds it
+        return io.BytesIO()
 
-# Certifications database
-CERTIFICATIONS = [
-    'aws certified', 'azure certified', 'comptia', 'cisco ccna', 'pmp', 'scrum master',
-    'google cloud certified', 'oracle certified', 'itil', 'cissp', 'ceh', 'rhce',
-    'salesforce certified', 'microsoft certified', 'cka', 'google analytics'
-]
+app = Flask(__name__)
+app.request_class = InMemoryUploadRequest
+# Werkzeug stops reading the body (413) as soon as it passes this limit, even without Content-Length
+app.config["MAX_CONTENT_LENGTH"] = MAX_RESUME_SIZE + MULTIPART_OVERHEAD
+CORS(app, supports_credentials=True, resources={
+    r"/*": {"origins": "*"}  # Open CORS for all routes
+})
 
-def extract_text_from_pdf(file_path):
-    """Extract text from PDF file"""
+def extract_text_from_pdf(source):
+    """Extract text from a PDF path or bytes, capped at MAX_PDF_PAGES pages and MAX_TEXT_BYTES of text"""
     text = ""
     try:
-        with open(file_path, 'rb') as file:
-            pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
-                text += page.extract_text() + " "
+        text = extract_pdf_text(source, backend="pypdf2", separator=" ")
     except Exception as e:
         app.logger.error(f"Error extracting text from PDF: {str(e)}")
     return text
 
-def extract_text_from_docx(file_path):
-    """Extract text from DOCX file"""
+def extract_text_from_docx(source):
+    """Extract text from a DOCX path or bytes"""
     text = ""
     try:
-        doc = docx.Document(file_path)
+        doc = docx.Document(io.BytesIO(source) if isinstance(source, bytes) else source)
         for para in doc.paragraphs:
             text += para.text + " "
     except Exception as e:
         app.logger.error(f"Error extracting text from DOCX: {str(e)}")
     return text
 
-def extract_text_from_resume(file_path):
-    """Extract text from resume file based on extension"""
-    file_ext = os.path.splitext(file_path)[1].lower()
+def resume_digest(source):
+    """SHA-256 of a resume given as a path or as bytes"""
+    return sha256_bytes(source) if isinstance(source, bytes) else file_sha256(source)
+
+def extract_text_from_resume(source, file_ext=None, digest=None):
+    """
+    Extract text from a resume path, or from its bytes plus `file_ext`, reusing
+    the cached text for identical files
+    """
+    file_ext = file_ext or os.path.splitext(source)[1].lower()
+    if file_ext not in ['.pdf', '.doc', '.docx']:
+        raise ValueError(f"Unsupported file type: {file_ext}")
+
+    digest = digest or resume_digest(source)
+    cached = get_resume_cache().get(digest, RESUME_CACHE_NAMESPACE)
+    if cached:
+        return cached["text"]
     
     if file_ext == '.pdf':
-        return extract_text_from_pdf(file_path)
-    elif file_ext in ['.doc', '.docx']:
-        return extract_text_from_docx(file_path)
+        text = extract_text_from_pdf(source)
     else:
-        raise ValueError(f"Unsupported file type: {file_ext}")
+        text = extract_text_from_docx(source)
 
-def extract_skills_from_text(text):
-    """Extract skills from text"""
+    get_resume_cache().put_text(digest, RESUME_CACHE_NAMESPACE, text)  # Failed parses are not cached
+    return text
+
+def extract_skills_from_text(text, taxonomy=None):
+    """Extract skills from text using the shared skill taxonomy (aliases map to canonical skills)"""
+    taxonomy = taxonomy or get_taxonomy()
     text = text.lower()
-    words = word_tokenize(text)
-    stop_words = set(stopwords.words('english'))
-    filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
+    found = taxonomy.find_skills(text)
+    found_certs = taxonomy.find_certifications(text)
     
-    # Initialize skills dictionary
+    # Report skills in taxonomy order
     skills = {
-        "Technical Skills": [],
-        "Soft Skills": [],
-        "Certifications": []
+        "Technical Skills": [
+            skill.title() for skill_list in taxonomy.technical_skills.values() for skill in skill_list
+            if skill in found
+        ],
+        "Soft Skills": [skill.title() for skill in taxonomy.soft_skills if skill in found],
+        "Certifications": [cert.title() for cert in taxonomy.certifications if cert.lower() in found_certs]
     }
     
-    # Find technical skills
-    for category, skill_list in TECHNICAL_SKILLS.items():
-        for skill in skill_list:
-            # Look for exact matches or matches with word boundaries
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text, re.IGNORECASE):
-                skills["Technical Skills"].append(skill.title())
-    
-    # Find soft skills
-    for skill in SOFT_SKILLS:
-        pattern = r'\b' + re.escape(skill) + r'\b'
-        if re.search(pattern, text, re.IGNORECASE):
-            skills["Soft Skills"].append(skill.title())
-    
-    # Find certifications
-    for cert in CERTIFICATIONS:
-        if cert.lower() in text:
-            skills["Certifications"].append(cert.title())
-    
     return skills
 
-def extract_skills_from_resume(resume_path):
-    """Extract skills from resume"""
+def extract_skills_from_resume(source, file_ext=None):
+    """Extract skills from a resume path, or from its bytes plus `file_ext`"""
     try:
-        # Extract text from resume
-        resume_text = extract_text_from_resume(resume_path)
-        if not resume_text.strip():
-            raise ValueError("Failed to extract text from resume")
-        
-        # Extract skills from text
-        skills = extract_skills_from_text(resume_text)
+        # Identical files skip parsing and matching entirely, until the taxonomy changes
+        taxonomy = get_taxonomy()
+        digest = resume_digest(source)
+        resume_cache = get_resume_cache()
+        cached = resume_cache.get(digest, RESUME_CACHE_NAMESPACE)
+        cached_skills = cached["skills"] if cached else None
+        if isinstance(cached_skills, dict) and cached_skills.get("taxonomy") == taxonomy.fingerprint:
+            skills = cached_skills["by_section"]
+        else:
+            # Extract text from resume
+            resume_text = extract_text_from_resume(source, file_ext, digest)
+            if not resume_text.strip():
+                raise ValueError("Failed to extract text from resume")
+            
+            # Extract skills from text
+            skills = extract_skills_from_text(resume_text, taxonomy)
+            resume_cache.put_skills(digest, RESUME_CACHE_NAMESPACE,
+                                    {"taxonomy": taxonomy.fingerprint, "by_section": skills})
         
         # Validate we got some meaningful skills
         all_skills = set()
@@ -185,75 +160,145 @@ def home():
         "status": "running",
         "endpoints": {
             "/analyze_resume": "POST with resume file",
-            "/skill_gap": "POST with resumeSkills"
+            "/analyze_resume/jobs": "POST with resume file, returns a job ID to poll",
+            "/analyze_resume/jobs/<job_id>": "GET job status and result",
+            "/skill_gap": "POST with resumeSkills",
+            "/taxonomy/reload": "POST to reload taxonomy.json"
         }
     })
 
+def file_too_large():
+    return jsonify({
+        "error": "File too large",
+        "max_size": f"{MAX_RESUME_SIZE/1024/1024}MB"
+    }), 413
+
+@app.errorhandler(RequestEntityTooLarge)
+def request_too_large(e):
+    return file_too_large()
+
+def analyze_resume_data(data, file_ext):
+    """Analysis response for a resume's bytes; runs in the request thread or an analysis worker"""
+    skills_data = extract_skills_from_resume(data, file_ext)
+    
+    # Flatten the skills for the overall skills list
+    all_skills = set()
+    for skill_list in skills_data.values():
+        all_skills.update(skill_list)
+    
+    return {
+        "success": True,
+        "skills": list(all_skills),
+        "skills_by_section": {k: list(v) for k, v in skills_data.items()}
+    }
+
+RESUME_JOBS = ResumeJobQueue(analyze_resume_data, max_workers=ANALYSIS_WORKERS,
+                             max_pending=MAX_PENDING_ANALYSES)
+
+def read_resume_upload():
+    """Validate the uploaded resume; returns (data, file_ext, None) or (None, None, error response)"""
+    if 'file' not in request.files:
+        return None, None, (jsonify({"error": "No file uploaded"}), 400)
+        
+    file = request.files['file']
+    if file.filename == '':
+        return None, None, (jsonify({"error": "No selected file"}), 400)
+        
+    file_ext = os.path.splitext(file.filename)[1].lower()
+    if file_ext not in ALLOWED_EXTENSIONS:
+        return None, None, (jsonify({
+            "error": "Unsupported file type",
+            "supported_types": list(ALLOWED_EXTENSIONS)
+        }), 400)
+        
+    # Read one byte past the limit to detect oversized files
+    data = file.stream.read(MAX_RESUME_SIZE + 1)
+    if len(data) > MAX_RESUME_SIZE:
+        return None, None, file_too_large()
+    return data, file_ext, None
+
 @app.route("/analyze_resume", methods=["POST"])
 def analyze_resume():
-    """Endpoint for resume file uploads"""
+    """Endpoint for resume file uploads, processed in memory"""
     try:
-        if 'file' not in request.files:
-            return jsonify({"error": "No file uploaded"}), 400
-            
-        file = request.files['file']
-        if file.filename == '':
-            return jsonify({"error": "No selected file"}), 400
-            
-        file_ext = os.path.splitext(file.filename)[1].lower()
-        if file_ext not in ALLOWED_EXTENSIONS:
-            return jsonify({
-                "error": "Unsupported file type",
-                "supported_types": list(ALLOWED_EXTENSIONS)
-            }), 400
+        data, file_ext, error = read_resume_upload()
+        if error:
+            return error
             
         try:
-            # Save temporarily
-            filename = f"upload_{datetime.now().timestamp()}{file_ext}"
-            filepath = os.path.join(DOWNLOAD_FOLDER, filename)
-            file.save(filepath)
-            
-            # Check file size
-            if os.path.getsize(filepath) > MAX_RESUME_SIZE:
-                os.remove(filepath)
-                return jsonify({
-                    "error": "File too large",
-                    "max_size": f"{MAX_RESUME_SIZE/1024/1024}MB"
-                }), 413
-            
-            # Analyze
-            skills_data = extract_skills_from_resume(filepath)
-            
-            # Flatten the skills for the overall skills list
-            all_skills = set()
-            for skill_list in skills_data.values():
-                all_skills.update(skill_list)
-            
-            return jsonify({
-                "success": True,
-                "skills": list(all_skills),
-                "skills_by_section": {k: list(v) for k, v in skills_data.items()}
-            })
+            return jsonify(analyze_resume_data(data, file_ext))
             
         except Exception as e:
             return jsonify({
                 "error": "Processing failed",
                 "details": str(e)
             }), 400
-            
-        finally:
-            if os.path.exists(filepath):
-                os.remove(filepath)
                 
+    except RequestEntityTooLarge:
+        return file_too_large()
     except Exception as e:
         return jsonify({
             "error": "Internal server error",
             "details": str(e)
         }), 500
 
+@app.route("/analyze_resume/jobs", methods=["POST"])
+def submit_resume_analysis():
+    """Queue a resume upload for analysis and return its job ID right away"""
+    try:
+        data, file_ext, error = read_resume_upload()
+        if error:
+            return error
+        
+        # Identical files share one job
+        try:
+            job_id, deduplicated = RESUME_JOBS.submit((sha256_bytes(data), file_ext), data, file_ext)
+        except QueueFullError:
+            response = jsonify({
+                "error": "Too many resumes being analyzed, try again shortly",
+                "max_pending": MAX_PENDING_ANALYSES
+            })
+            response.headers["Retry-After"] = "5"
+            return response, 429
+        
+        return jsonify({
+            "success": True,
+            "job_id": job_id,
+            "deduplicated": deduplicated,
+            "status_url": f"/analyze_resume/jobs/{job_id}"
+        }), 202
+    
+    except RequestEntityTooLarge:
+        return file_too_large()
+    except Exception as e:
+        return jsonify({
+            "error": "Internal server error",
+            "details": str(e)
+        }), 500
+
+@app.route("/analyze_resume/jobs/<job_id>", methods=["GET"])
+def resume_analysis_status(job_id):
+    """Progress of a queued analysis; includes the /analyze_resume response once done"""
+    status = RESUME_JOBS.status(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown or expired job", "job_id": job_id}), 404
+    return jsonify(status)
+
+def build_recommendations(scores):
+    """Most commonly missing skills across the bookmarked jobs, followed by general advice"""
+    if not scores:
+        return ["Bookmark some jobs and run main_script.py to extract their skills"]
+    missing_counts = Counter(skill for score in scores for skill in score["missing"])
+    recommendations = [
+        f"Learn {skill.title()}: required by {count} of your {len(scores)} bookmarked jobs"
+        for skill, count in missing_counts.most_common(TOP_MISSING_SKILLS)
+    ]
+    recommendations.append("Check our resources section for learning materials")
+    return recommendations
+
 @app.route("/skill_gap", methods=["POST"])
 def get_skill_gap():
-    """Mock skill gap analysis"""
+    """Skill gap analysis against the skills extracted from the bookmarked jobs"""
     try:
         data = request.get_json()
         if not data:
@@ -270,56 +315,76 @@ def get_skill_gap():
                 "provided_skills": resume_skills
             }), 400
             
-        # Enhanced mock data with all required fields
-        demo_skill_gaps = {
-            "LinkedIn": [
-                {
-                    "title": "Senior Python Developer at TechCorp",
-                    "required_skills": ["Python", "Django", "AWS", "React"],
-                    "your_skills": [skill for skill in ["Python", "React", "AWS"] if skill in resume_skills],
-                    "missing_skills": [skill for skill in ["Django"] if skill not in resume_skills],
-                    "match_percentage": 75.0,
-                    "resume_skills": resume_skills
-                },
-                {
-                    "title": "Frontend Developer at WebSolutions",
-                    "required_skills": ["JavaScript", "React", "CSS", "HTML5"],
-                    "your_skills": [skill for skill in ["JavaScript", "React"] if skill in resume_skills],
-                    "missing_skills": [skill for skill in ["CSS", "HTML5"] if skill not in resume_skills],
-                    "match_percentage": 50.0,
-                    "resume_skills": resume_skills
-                }
-            ]
-        }
+        scores = JOB_SKILL_INDEX.score(resume_skills)
+        
+        # Group jobs by source, best matches first
+        skill_gaps = {}
+        for score in sorted(scores, key=lambda score: -score["match_percentage"]):
+            job = score["job"]
+            skill_gaps.setdefault(job["source"], []).append({
+                "title": job["title"],
+                "url": job["url"],
+                "required_skills": [skill.title() for skill in sorted(job["skills"])],
+                "your_skills": [skill.title() for skill in score["matched"]],
+                "missing_skills": [skill.title() for skill in score["missing"]],
+                "match_percentage": score["match_percentage"],
+                "resume_skills": resume_skills
+            })
         
-        match_stats = {
-            "LinkedIn": {
-                "total_jobs": 2,
-                "matched_jobs": 0,
-                "match_rate": 0.0
+        match_stats = {}
+        for source, jobs in skill_gaps.items():
+            matched_jobs = sum(1 for job in jobs if job["match_percentage"] >= MATCH_THRESHOLD)
+            match_stats[source] = {
+                "total_jobs": len(jobs),
+                "matched_jobs": matched_jobs,
+                "match_rate": round(matched_jobs / len(jobs) * 100, 1)
             }
-        }
+        
+        total_jobs = len(scores)
+        total_matched = sum(stats["matched_jobs"] for stats in match_stats.values())
         
         return jsonify({
             "success": True,
-            "skill_gaps": demo_skill_gaps,
+            "skill_gaps": skill_gaps,
             "match_stats": match_stats,
             "summary": {
-                "total_jobs": 2,
-                "total_matched": 0,
-                "overall_match_rate": 0.0,
+                "total_jobs": total_jobs,
+                "total_matched": total_matched,
+                "overall_match_rate": round(total_matched / total_jobs * 100, 1) if total_jobs else 0.0,
                 "resume_skills": resume_skills,
                 "analyzed_at": datetime.now().isoformat(),
-                "recommendations": [
-                    "Focus on learning the missing skills highlighted above",
-                    "Check our resources section for learning materials",
-                    "Consider taking online courses for the skills you're missing"
-                ]
+                "recommendations": build_recommendations(scores)
             }
         })
             
     except Exception as e:
+        app.logger.error(f"Skill gap analysis failed: {str(e)}")
         return jsonify({"error": "Internal server error"}), 500
 
+@app.route("/taxonomy/reload", methods=["POST"])
+def reload_skill_taxonomy():
+    """
+    Reload taxonomy.json now instead of waiting for the periodic change check.
+    Only accepted from this machine and not from browsers (which send Origin), so
+    no web page can trigger it through the open CORS policy.
+    """
+    if request.remote_addr not in LOCAL_ADDRESSES or request.headers.get("Origin"):
+        return jsonify({"error": "Forbidden"}), 403
+    try:
+        taxonomy = reload_taxonomy()
+    except Exception as e:
+        # The previous taxonomy stays in service
+        return jsonify({
+            "error": "Invalid taxonomy file",
+            "details": str(e),
+            "version": get_taxonomy().version
+        }), 400
+    return jsonify({
+        "success": True,
+        "version": taxonomy.version,
+        "fingerprint": taxonomy.fingerprint
+    })
+
 if __name__ == "__main__":
+    JOB_SKILL_INDEX.ensure_schema()  # Migrate the skill tables once, before serving /skill_gap
     app.run(port=5002, debug=True)
\ No newline at end of file
@@ -1,7 +1,8 @@
 from flask import Flask, jsonify, request # type: ignore
 from flask_cors import CORS # type: ignore
 import sqlite3
-import urllib.parse
+from bookmark_normalizer import normalize_domain
+from bookmarks_store import bookmark_row, ensure_normalized_columns
 
 app = Flask(__name__)
 CORS(app)
@@ -21,20 +22,20 @@ def init_db():
         )
     ''')
     conn.commit()
+    ensure_normalized_columns(conn)
     conn.close()
 
 def get_bookmarks():
     conn = get_db_connection()
     cursor = conn.cursor()
-    cursor.execute("SELECT title, url FROM bookmarks")
+    cursor.execute("SELECT title, url, domain FROM bookmarks")  # Domain stored at insert time
     bookmarks = cursor.fetchall()
     conn.close()
     
     categorized_bookmarks = {}
 
-    for title, url in bookmarks:
-        domain = urllib.parse.urlparse(url).netloc  # Extract website domain
-
+    for title, url, domain in bookmarks:
+        domain = domain if domain is not None else normalize_domain(url)  # Row not written via bookmark_row
         if domain not in categorized_bookmarks:
             categorized_bookmarks[domain] = []
 
@@ -62,7 +63,8 @@ def add_bookmark():
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
-        cursor.execute("INSERT INTO bookmarks (title, url) VALUES (?, ?)", (title, url))
+        cursor.execute("INSERT INTO bookmarks (title, url, normalized_title, domain) VALUES (?, ?, ?, ?)",
+                       bookmark_row(title, url))
         conn.commit()
         conn.close()
         return jsonify({"message": "Bookmark added successfully"}), 201
@@ -78,20 +80,21 @@ def delete_bookmark():
     if not url_to_delete:
         return jsonify({"error": "No URL provided"}), 400
 
-    domain = urllib.parse.urlparse(url_to_delete).netloc.lower() or url_to_delete.lower()
+    domain = normalize_domain(url_to_delete).lower() or url_to_delete.lower()
     print(f"Trying to delete domain: {domain}")
 
     conn = get_db_connection()
     cursor = conn.cursor()
 
     # Find all bookmarks matching this domain
-    cursor.execute("SELECT * FROM bookmarks")
+    cursor.execute("SELECT url, domain FROM bookmarks")
     bookmarks = cursor.fetchall()
 
     deleted = False
     for bookmark in bookmarks:
         stored_url = bookmark["url"]
-        stored_domain = urllib.parse.urlparse(stored_url).netloc.lower().rstrip('/')
+        stored_domain = bookmark["domain"] if bookmark["domain"] is not None else normalize_domain(stored_url)
+        stored_domain = stored_domain.lower().rstrip('/')
 
         if stored_domain == domain:
             cursor.execute("DELETE FROM bookmarks WHERE url = ?", (stored_url,))
@@ -0,0 +1,71 @@
+"""
+Benchmark of saving extracted skills for a full run of bookmarks.
+
+Compares the old per-URL pattern (new connection, one UPDATE and a commit for
+every bookmark) with bookmarks_store.BookmarkWriter, which writes with
+executemany inside one transaction in WAL mode.
+
+Run from the repository root: python -m benchmarks.bench_bookmark_writes [count]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from bookmarks_store import BookmarkWriter, connect, ensure_schema
+
+SKILLS = ["python", "sql", "marketing", "design", "data", "cloud", "management", "content"]
+
+def make_database(path, count):
+    conn = sqlite3.connect(path)
+    conn.execute('''CREATE TABLE bookmarks
+                    (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    url TEXT UNIQUE,
+                    title TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)''')
+    conn.executemany("INSERT INTO bookmarks (url, title) VALUES (?, ?)",
+                     [(f"https://example.com/jobs/{i}", f"Job {i}") for i in range(count)])
+    conn.commit()
+    ensure_schema(conn)
+    conn.close()
+
+def fake_results(count):
+    return [(f"https://example.com/jobs/{i}", SKILLS[i % 5:i % 5 + 3]) for i in range(count)]
+
+def per_url_writes(path, results):
+    """The original save_extracted_skills: one connection and commit per URL."""
+    for job_url, skills in results:
+        conn = sqlite3.connect(path)
+        cursor = conn.cursor()
+        cursor.execute("UPDATE bookmarks SET skills = ? WHERE url = ?", (",".join(skills), job_url))
+        conn.commit()
+        conn.close()
+
+def batched_writes(path, results):
+    conn = connect(path)
+    writer = BookmarkWriter(conn, batch_size=len(results))
+    for job_url, skills in results:
+        writer.add_skills(job_url, skills)
+    writer.close()
+    conn.close()
+
+def timed(label, write, count):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "bookmarks.db")
+        make_database(path, count)
+        results = fake_results(count)
+        start = time.perf_counter()
+        write(path, results)
+        elapsed = time.perf_counter() - start
+
+        saved = sqlite3.connect(path).execute("SELECT COUNT(*) FROM bookmarks WHERE skills IS NOT NULL").fetchone()[0]
+        assert saved == count, f"{label}: only {saved} of {count} rows saved"
+    print(f"{label:<40} {elapsed:8.2f} s  ({count / elapsed:,.0f} rows/s)")
+    return elapsed
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    print(f"Saving skills for {count} bookmarks\n")
+    baseline = timed("connection + commit per URL", per_url_writes, count)
+    batched = timed("executemany, one transaction, WAL", batched_writes, count)
+    print(f"\nSpeedup: {baseline / batched:.0f}x")
@@ -0,0 +1,59 @@
+"""
+Micro-benchmark of the job-category check used by job_Des.extract_keywords.
+
+Compares the original `any(category in term ...)` scan with the precompiled
+Aho-Corasick matcher (with and without the per-lemma memo) on a synthetic
+stream of lemmas, and verifies both give identical answers.
+
+Run from the repository root: python -m benchmarks.bench_category_matcher
+"""
+import random
+import string
+import time
+from taxonomy import load_taxonomy
+
+TAXONOMY = load_taxonomy()
+JOB_RELATED_CATEGORIES = TAXONOMY.job_categories
+CATEGORY_MATCHER = TAXONOMY.category_matcher
+
+def original_check(lemma):
+    """The pre-automaton predicate from extract_keywords."""
+    lowered = lemma.lower()
+    return (any(category in lowered for category in JOB_RELATED_CATEGORIES)
+            or any(category in lemma for category in JOB_RELATED_CATEGORIES))
+
+def uncached_check(lemma):
+    return CATEGORY_MATCHER.contains_any(lemma.lower()) or CATEGORY_MATCHER.contains_any(lemma)
+
+def make_lemmas(count, vocabulary_size=3000, seed=7):
+    """Zipf-ish stream of lemmas: category words, near misses and random nouns."""
+    rng = random.Random(seed)
+    vocabulary = list(JOB_RELATED_CATEGORIES)
+    vocabulary += [category[:-1] for category in JOB_RELATED_CATEGORIES if len(category) > 3]
+    vocabulary += ["UI", "UX", "ui", "ux", "Data", "webinar", "hr", "bookkeeping"]
+    while len(vocabulary) < vocabulary_size:
+        length = rng.randint(3, 12)
+        vocabulary.append("".join(rng.choice(string.ascii_lowercase) for _ in range(length)))
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]
+    rng.shuffle(vocabulary)
+    return rng.choices(vocabulary, weights=weights, k=count)
+
+def timed(label, check, lemmas):
+    start = time.perf_counter()
+    answers = [check(lemma) for lemma in lemmas]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<32} {elapsed * 1000:8.1f} ms  ({elapsed / len(lemmas) * 1e6:.2f} us/lemma)")
+    return answers, elapsed
+
+if __name__ == "__main__":
+    lemmas = make_lemmas(200_000)
+    print(f"{len(lemmas)} lemmas, {len(set(lemmas))} distinct, {len(JOB_RELATED_CATEGORIES)} categories\n")
+
+    expected, baseline = timed("any(category in term)", original_check, lemmas)
+    automaton, automaton_time = timed("Aho-Corasick", uncached_check, lemmas)
+    memoized, memoized_time = timed("Aho-Corasick + lemma memo", TAXONOMY.is_job_related_lemma, lemmas)
+
+    assert automaton == expected, "automaton disagrees with the substring scan"
+    assert memoized == expected, "memoized matcher disagrees with the substring scan"
+    print(f"\nIdentical results. Speedup: {baseline / automaton_time:.1f}x uncached, "
+          f"{baseline / memoized_time:.1f}x memoized")
@@ -0,0 +1,91 @@
+"""
+Timings for resume PDF text extraction on a synthetic 50-page PDF.
+
+Compares the original single-threaded loops (skill_gap's list comprehension,
+which calls extract_text twice per page, and app_three's string concatenation)
+with pdf_text.extract_pdf_text, which opens the PDF once, calls extract_text
+once per page and stops at the page and byte caps. The last row shows the byte
+cap bounding the work on an oversized PDF.
+
+Run from the repository root: python -m benchmarks.bench_pdf_extraction [pages]
+"""
+import io
+import sys
+import time
+import pdfplumber
+import PyPDF2
+from pdf_text import extract_pdf_text
+
+LINES = [
+    "Experienced Python developer with SQL, Docker and Kubernetes in production.",
+    "Built machine learning pipelines with pandas, numpy and scikit-learn.",
+    "Led a team of five engineers; strong communication and project management.",
+    "Designed REST APIs in Flask and Django backed by PostgreSQL and Redis.",
+]
+
+def make_pdf(page_count, lines_per_page=45):
+    """A minimal multi-page PDF with Helvetica text, written by hand."""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None,
+               b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_ids = []
+    for page in range(page_count):
+        text = [b"BT /F1 9 Tf 40 800 Td 11 TL"]
+        for line in range(lines_per_page):
+            content = f"Page {page + 1} line {line + 1}: {LINES[line % len(LINES)]}"
+            text.append(b"(" + content.encode("latin-1") + b") Tj T*")
+        text.append(b"ET")
+        stream = b"\n".join(text)
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_id = len(objects)
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id)
+        page_ids.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % page_id for page_id in page_ids)
+    objects[1] = b"<< /Type /Pages /Kids [" + kids + b"] /Count %d >>" % page_count
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(output.tell())
+        output.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+    xref = output.tell()
+    output.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        output.write(b"%010d 00000 n \n" % offset)
+    output.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return output.getvalue()
+
+def original_pdfplumber(data):
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
+
+def original_pypdf2(data):
+    text = ""
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    for page in pdf_reader.pages:
+        text += page.extract_text() + " "
+    return text
+
+def timed(label, extract, data):
+    start = time.perf_counter()
+    text = extract(data)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<44} {elapsed:7.2f} s  ({len(text):,} chars)")
+    return elapsed
+
+if __name__ == "__main__":
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    data = make_pdf(pages)
+    print(f"Synthetic PDF: {pages} pages, {len(data):,} bytes\n")
+
+    before = timed("pdfplumber, extract_text twice per page", original_pdfplumber, data)
+    after = timed("pdfplumber, extract_pdf_text", lambda d: extract_pdf_text(d, backend="pdfplumber"), data)
+    print(f"  speedup {before / after:.1f}x\n")
+
+    before = timed("PyPDF2, string concatenation", original_pypdf2, data)
+    after = timed("PyPDF2, extract_pdf_text", lambda d: extract_pdf_text(d, backend="pypdf2", separator=" "), data)
+    print(f"  speedup {before / after:.1f}x\n")
+
+    timed("pdfplumber, extract_pdf_text, 16 KB cap",
+          lambda d: extract_pdf_text(d, backend="pdfplumber", max_bytes=16 * 1024), data)
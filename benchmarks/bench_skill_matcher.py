@@ -0,0 +1,87 @@
+"""
+Benchmark of resume skill extraction in app_three.
+
+Compares the original extract_skills_from_text (one re.search per skill plus an
+unused word_tokenize/stopword pass) with the compiled single-scan SkillMatcher
+now used by app_three, on synthetic resumes, and verifies both return identical
+skills. The taxonomy's aliases are left out for the comparison, since the
+original had none.
+
+Run from the repository root: python -m benchmarks.bench_skill_matcher [count]
+"""
+import random
+import re
+import sys
+import time
+from nltk.tokenize import word_tokenize
+from nltk.corpus import stopwords
+import json
+from app_three import extract_skills_from_text
+from taxonomy import TAXONOMY_PATH, Taxonomy
+
+with open(TAXONOMY_PATH, encoding="utf-8") as file:
+    TAXONOMY = Taxonomy({**json.load(file), "aliases": {}}, fingerprint=None)
+TECHNICAL_SKILLS = TAXONOMY.technical_skills
+SOFT_SKILLS = TAXONOMY.soft_skills
+CERTIFICATIONS = TAXONOMY.certifications
+
+FILLER = ("led", "team", "of", "engineers", "built", "the", "platform", "using", "and", "with",
+          "improved", "latency", "by", "40%", "for", "customers", "in", "production", "designed",
+          "Java/JavaScript", "C++", "c#,", "node.js.", "CI/CD", "AWS-certified", "(SQL)", "R,",
+          "scikit-learn;", "Machine", "Learning", "go-to-market", "restful", "Javascript", "ſpark")
+
+def original_extract(text):
+    """The pre-matcher extract_skills_from_text."""
+    text = text.lower()
+    words = word_tokenize(text)
+    stop_words = set(stopwords.words('english'))
+    filtered_words = [word for word in words if word.isalnum() and word not in stop_words]
+
+    skills = {"Technical Skills": [], "Soft Skills": [], "Certifications": []}
+    for category, skill_list in TECHNICAL_SKILLS.items():
+        for skill in skill_list:
+            pattern = r'\b' + re.escape(skill) + r'\b'
+            if re.search(pattern, text, re.IGNORECASE):
+                skills["Technical Skills"].append(skill.title())
+    for skill in SOFT_SKILLS:
+        pattern = r'\b' + re.escape(skill) + r'\b'
+        if re.search(pattern, text, re.IGNORECASE):
+            skills["Soft Skills"].append(skill.title())
+    for cert in CERTIFICATIONS:
+        if cert.lower() in text:
+            skills["Certifications"].append(cert.title())
+    return skills
+
+def make_resumes(count, words_per_resume=600, seed=11):
+    """Resumes mixing skill names (in varied case and punctuation) with filler words."""
+    rng = random.Random(seed)
+    vocabulary = [skill for skill_list in TECHNICAL_SKILLS.values() for skill in skill_list]
+    vocabulary += SOFT_SKILLS + CERTIFICATIONS
+    resumes = []
+    for _ in range(count):
+        words = []
+        for _ in range(words_per_resume):
+            if rng.random() < 0.08:
+                skill = rng.choice(vocabulary)
+                words.append(rng.choice((skill, skill.upper(), skill.title(), skill + ",", "(" + skill + ")")))
+            else:
+                words.append(rng.choice(FILLER))
+        resumes.append(" ".join(words))
+    return resumes
+
+def timed(label, extract, resumes):
+    start = time.perf_counter()
+    results = [extract(text) for text in resumes]
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000 / len(resumes):8.3f} ms/resume")
+    return elapsed, results
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    resumes = make_resumes(count)
+    print(f"Extracting skills from {count} synthetic resumes\n")
+    baseline, expected = timed("re.search per skill + tokenize", original_extract, resumes)
+    compiled, actual = timed("compiled single-scan matcher",
+                             lambda text: extract_skills_from_text(text, TAXONOMY), resumes)
+    assert actual == expected, "matchers disagree"
+    print(f"\nIdentical results; speedup: {baseline / compiled:.1f}x")
@@ -0,0 +1,68 @@
+"""
+Benchmark of normalizing bookmark titles and domains.
+
+Compares the original per-row code (app_four.clean_title with seven uncompiled
+re.sub passes, app_two's urlparse per row) with bookmark_normalizer's batch
+functions, cold (empty memo) and warm, and checks that the output is identical.
+
+Run from the repository root: python -m benchmarks.bench_title_normalizer [count]
+"""
+import random
+import re
+import sys
+import time
+import urllib.parse
+from bookmark_normalizer import normalize_domain, normalize_domains, normalize_title, normalize_titles
+
+ROLES = ["Data Analyst", "Software Engineer", "Product Manager", "UX Designer", "Marketing Intern",
+         "Backend Developer", "Machine Learning Engineer", "Business Analyst", "Content Writer",
+         "DevOps Engineer", "Full-Time Sales Associate", "HR Executive"]
+SUFFIXES = ["", " | Indeed", " | LinkedIn", " - Remote", " - Bangalore, India", " at Acme Corp",
+            " Internship by Globex", " (Work From Home) | Naukri", " // Unstop"]
+SITES = ["www.linkedin.com/jobs/view", "in.indeed.com/viewjob", "unstop.com/internships",
+         "www.naukri.com/job-listings", "careers.acme.com/jobs", "boards.greenhouse.io/globex"]
+
+def legacy_clean_title(raw_title):
+    """app_four.clean_title before bookmark_normalizer."""
+    title = raw_title.lower()
+    title = re.sub(r'\|.*', '', title)
+    title = re.sub(r'-\s*(bangalore|gurgaon|remote|india).*', '', title)
+    title = re.sub(r'(at|by)\s+[\w\s,.]+', '', title)
+    title = re.sub(r'\b(internship|full[- ]?time|work from home)\b', '', title)
+    title = re.sub(r'\b(unstop|indeed|naukri|linkedin|sarjapura)\b', '', title)
+    title = re.sub(r'[^a-z\s]', '', title)
+    title = re.sub(r'\s+', ' ', title).strip()
+    return title.title()
+
+def synthetic_bookmarks(count, seed=0):
+    """Titles repeat across boards like real bookmarks do; every URL is unique."""
+    rng = random.Random(seed)
+    titles = [rng.choice(ROLES) + (f" {rng.randint(1, 400)}" if rng.random() < 0.5 else "") + rng.choice(SUFFIXES)
+              for _ in range(count)]
+    urls = [f"https://{rng.choice(SITES)}/{i}?ref=bookmark" for i in range(count)]
+    return titles, urls
+
+def timed(label, normalize, values):
+    start = time.perf_counter()
+    result = normalize(values)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms  ({len(values) / elapsed:,.0f} rows/s)")
+    return result, elapsed
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    titles, urls = synthetic_bookmarks(count)
+    print(f"Normalizing {count} bookmarks ({len(set(titles))} distinct titles)\n")
+
+    expected, baseline = timed("titles: re.sub per row", lambda values: [legacy_clean_title(v) for v in values], titles)
+    normalize_title.cache_clear()
+    cold, cold_time = timed("titles: normalize_titles, cold", normalize_titles, titles)
+    warm, warm_time = timed("titles: normalize_titles, warm", normalize_titles, titles)
+    assert cold == expected and warm == expected, "normalized titles differ from clean_title"
+    print(f"Speedup: {baseline / cold_time:.1f}x cold, {baseline / warm_time:.1f}x warm\n")
+
+    expected, baseline = timed("domains: urlparse per row", lambda values: [urllib.parse.urlparse(v).netloc for v in values], urls)
+    normalize_domain.cache_clear()
+    domains, domain_time = timed("domains: normalize_domains", normalize_domains, urls)
+    assert domains == expected, "normalized domains differ from urlparse"
+    print(f"Speedup: {baseline / domain_time:.1f}x (stored at insert time, reads no longer parse at all)")
@@ -0,0 +1,76 @@
+"""
+Import-time budget check for the scraper and the Flask services.
+
+Imports each module in a fresh interpreter with `python -X importtime` and fails
+(exit status 1) if its cumulative import time exceeds the budget, or if it
+imports spaCy or NLTK at all: those are loaded lazily by nlp_resources on first
+use. Each module is imported a few times and the fastest run is compared, to
+keep the check stable on a noisy machine.
+
+Run from the repository root: python -m benchmarks.check_import_time [runs]
+"""
+import os
+import subprocess
+import sys
+
+# Cumulative import time budgets in milliseconds
+IMPORT_BUDGETS_MS = {
+    "job_Des": 800,
+    "main_script": 800,
+    "skill_gap": 800,
+    "app_three": 1000,
+}
+
+# Heavy packages that must only be imported when first used
+LAZY_PACKAGES = ("spacy", "nltk", "thinc")
+
+def import_profile(module):
+    """Return ({imported module: cumulative microseconds}, top-level cumulative microseconds)."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=root, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr[-2000:]}")
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        timings[name.strip()] = int(cumulative)
+    return timings, timings[module]
+
+def check(module, budget_ms, runs=3):
+    """Print the module's best import time; return a list of problems found."""
+    best = None
+    for _ in range(runs):
+        try:
+            timings, total = import_profile(module)
+        except RuntimeError as e:
+            print(f"{module:<15} {'-':>8}     (budget {budget_ms:5d} ms)  FAIL")
+            return [str(e)]
+        best = total if best is None else min(best, total)
+
+    problems = []
+    eager = sorted({name.split(".")[0] for name in timings} & set(LAZY_PACKAGES))
+    if eager:
+        problems.append(f"{module} imports {', '.join(eager)} at import time")
+    if best / 1000 > budget_ms:
+        problems.append(f"{module} took {best / 1000:.0f} ms to import (budget {budget_ms} ms)")
+
+    status = "FAIL" if problems else "ok"
+    print(f"{module:<15} {best / 1000:8.0f} ms  (budget {budget_ms:5d} ms)  {status}")
+    return problems
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    problems = []
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        problems.extend(check(module, budget_ms, runs))
+
+    if problems:
+        print("\n" + "\n".join(problems))
+        sys.exit(1)
+    print("\nAll imports within budget")
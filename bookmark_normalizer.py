@@ -0,0 +1,52 @@
+import re
+from functools import lru_cache
+from urllib.parse import urlparse
+
+# Memo sizes; job titles repeat heavily across boards, domains even more
+TITLE_CACHE_SIZE = 65536
+DOMAIN_CACHE_SIZE = 16384
+
+# app_four's clean_title passes, compiled once and applied in the same order
+_TITLE_PASSES = [
+    (re.compile(r'\|.*'), ''),                                         # Anything after '|'
+    (re.compile(r'-\s*(bangalore|gurgaon|remote|india).*'), ''),       # Location
+    (re.compile(r'(at|by)\s+[\w\s,.]+'), ''),                          # 'at CompanyName'
+    (re.compile(r'\b(internship|full[- ]?time|work from home)\b'), ''),
+    (re.compile(r'\b(unstop|indeed|naukri|linkedin|sarjapura)\b'), ''),
+    (re.compile(r'[^a-z\s]'), ''),                                     # Punctuation
+]
+_WHITESPACE = re.compile(r'\s+')
+
+# Netloc of a plain "scheme://host/..." URL; anything unusual goes through urlparse
+_PLAIN_URL_NETLOC = re.compile(r'[A-Za-z][A-Za-z0-9+.-]*://([^/?#\[\]]*)(?:[/?#]|$)')
+_URL_UNSAFE = re.compile(r'[\t\r\n]')
+
+@lru_cache(maxsize=TITLE_CACHE_SIZE)
+def normalize_title(raw_title):
+    """
+    Job title reduced to the role, e.g. "Data Analyst | Indeed" -> "Data Analyst":
+    job boards, locations, companies and employment types removed, then title-cased.
+    """
+    title = (raw_title or "").lower()
+    for pattern, replacement in _TITLE_PASSES:
+        title = pattern.sub(replacement, title)
+    return _WHITESPACE.sub(' ', title).strip().title()
+
+@lru_cache(maxsize=DOMAIN_CACHE_SIZE)
+def normalize_domain(url):
+    """Website domain (netloc) of a URL, as bookmarks are grouped by; same as urlparse(url).netloc."""
+    url = url or ""
+    match = _PLAIN_URL_NETLOC.match(url)
+    if match and match.group(1).isascii() and not _URL_UNSAFE.search(url):
+        return match.group(1)
+    return urlparse(url).netloc
+
+def normalize_titles(raw_titles):
+    """normalize_title() for many titles, computing each distinct title once."""
+    normalized = {title: normalize_title(title) for title in set(raw_titles)}
+    return [normalized[title] for title in raw_titles]
+
+def normalize_domains(urls):
+    """normalize_domain() for many URLs, computing each distinct URL once."""
+    normalized = {url: normalize_domain(url) for url in set(urls)}
+    return [normalized[url] for url in urls]
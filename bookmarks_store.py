@@ -0,0 +1,275 @@
+import sqlite3
+from bookmark_normalizer import normalize_domain, normalize_domains, normalize_title, normalize_titles
+
+DB_PATH = "bookmarks.db"
+
+# Bumped whenever a one-time data migration is added; stored in PRAGMA user_version
+SCHEMA_VERSION = 1
+
+# Failed bookmarks are retried after RETRY_BASE_SECONDS, doubling per failure up to RETRY_MAX_SECONDS
+RETRY_BASE_SECONDS = 60 * 60
+RETRY_MAX_SECONDS = 14 * 24 * 60 * 60
+
+def connect(db_path=DB_PATH, check_same_thread=True):
+    """
+    Open the bookmarks database in WAL mode, so the Flask bookmark services can
+    keep reading while the scraper writes.
+    """
+    conn = sqlite3.connect(db_path, check_same_thread=check_same_thread)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")  # Durable enough with WAL, far fewer fsyncs
+    return conn
+
+def ensure_schema(conn):
+    """Add the scraper's columns and tables to the bookmarks database if they are missing."""
+    existing = {row[1] for row in conn.execute("PRAGMA table_info(bookmarks)")}
+    with conn:
+        for column, definition in (("skills", "TEXT"), ("last_scraped_at", "TIMESTAMP"),
+                                   ("content_hash", "TEXT"), ("failure_count", "INTEGER DEFAULT 0"),
+                                   ("next_attempt_at", "TIMESTAMP")):
+            if column not in existing:
+                conn.execute(f"ALTER TABLE bookmarks ADD COLUMN {column} {definition}")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS scrape_checkpoints (
+                run_id INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                status TEXT NOT NULL,
+                completed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (run_id, url)
+            )
+        ''')
+
+        # Normalized skills: a dictionary of names plus a bookmark <-> skill join table,
+        # indexed in both directions (the primary key covers bookmark -> skill)
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS skills (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL UNIQUE
+            )
+        ''')
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS bookmark_skills (
+                bookmark_id INTEGER NOT NULL,
+                skill_id INTEGER NOT NULL,
+                PRIMARY KEY (bookmark_id, skill_id)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_bookmark_skills_skill ON bookmark_skills (skill_id, bookmark_id)")
+        # The Flask services delete bookmarks directly, so clean up their skill links here
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS bookmarks_delete_skills AFTER DELETE ON bookmarks
+            BEGIN
+                DELETE FROM bookmark_skills WHERE bookmark_id = OLD.id;
+            END
+        ''')
+
+    if conn.execute("PRAGMA user_version").fetchone()[0] < 1:
+        migrate_skills_column(conn)
+    ensure_normalized_columns(conn)
+
+def add_missing_columns(conn, columns):
+    """
+    Add the (name, definition) columns that bookmarks lacks. The check and the ALTERs
+    run in one BEGIN IMMEDIATE transaction, so services starting at the same time
+    cannot both add a column; "duplicate column" is still taken as already added.
+    Returns False, changing nothing, when there is no bookmarks table yet.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        existing = {row[1] for row in conn.execute("PRAGMA table_info(bookmarks)")}
+        if not existing:
+            conn.rollback()
+            return False
+        for column, definition in columns:
+            if column not in existing:
+                try:
+                    conn.execute(f"ALTER TABLE bookmarks ADD COLUMN {column} {definition}")
+                except sqlite3.OperationalError as e:
+                    if "duplicate column" not in str(e):
+                        raise
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return True
+
+def ensure_normalized_columns(conn):
+    """
+    Add the normalized_title and domain columns, which every writer fills at insert
+    time, and fill them in batches for rows that predate them. Returns rows filled.
+    """
+    if not add_missing_columns(conn, [("normalized_title", "TEXT"), ("domain", "TEXT")]):
+        return 0  # No bookmarks yet; the service that creates the table calls this again
+
+    rows = conn.execute("SELECT id, title, url FROM bookmarks WHERE normalized_title IS NULL OR domain IS NULL").fetchall()
+    if not rows:
+        return 0
+    titles = normalize_titles([row[1] for row in rows])
+    domains = normalize_domains([row[2] for row in rows])
+    with conn:
+        conn.executemany("UPDATE bookmarks SET normalized_title = ?, domain = ? WHERE id = ?",
+                         [(title, domain, row[0]) for row, title, domain in zip(rows, titles, domains)])
+    print(f"Normalized titles and domains of {len(rows)} bookmarks")
+    return len(rows)
+
+def bookmark_row(title, url):
+    """(title, url, normalized_title, domain) for inserting a new bookmark."""
+    return title, url, normalize_title(title), normalize_domain(url)
+
+def normalize_skill(skill):
+    """Canonical form of a skill name as stored in the skills table."""
+    return skill.strip().lower()
+
+def migrate_skills_column(conn):
+    """
+    One-time copy of the comma-joined bookmarks.skills column into the
+    skills / bookmark_skills tables. Returns the number of links created.
+    """
+    rows = conn.execute("SELECT id, skills FROM bookmarks WHERE skills IS NOT NULL AND skills != ''").fetchall()
+    links = {
+        (bookmark_id, normalize_skill(skill))
+        for bookmark_id, skills in rows
+        for skill in skills.split(",") if skill.strip()
+    }
+    with conn:
+        conn.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)", {(name,) for _, name in links})
+        conn.executemany('''
+            INSERT OR IGNORE INTO bookmark_skills (bookmark_id, skill_id)
+            SELECT ?, id FROM skills WHERE name = ?
+        ''', links)
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    print(f"Migrated {len(links)} skills from {len(rows)} bookmarks into the skills tables")
+    return len(links)
+
+
+class BookmarkWriter:
+    """
+    Buffers scrape outcomes and writes them with executemany in one transaction
+    per flush: skills and scrape state on the bookmark, the bookmark_skills links
+    and the run checkpoint of each saved bookmark (failures are not checkpointed,
+    so a resumed run tries them again).
+
+    Call flush() after each chunk of a streaming run (or once for a whole run);
+    flush() is also called automatically every `batch_size` outcomes and on close().
+    """
+
+    def __init__(self, conn, run_id=None, batch_size=500):
+        self.conn = conn
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self._saved = []   # (skills_string, content_hash, url)
+        self._links = []   # (url, skill name)
+        self._failed = []  # url
+        self.unchanged = 0  # Saved bookmarks whose description hash matched, so their skills were kept
+
+    def add_skills(self, job_url, skills, description_hash=None):
+        """Queue the extracted skills of a successfully scraped bookmark."""
+        self._saved.append((",".join(skills), description_hash, job_url))
+        self._links.extend((job_url, name) for name in {normalize_skill(skill) for skill in skills} if name)
+        self._maybe_flush()
+
+    def add_failure(self, job_url):
+        """Queue a bookmark that finished without a description."""
+        self._failed.append(job_url)
+        self._maybe_flush()
+
+    def _maybe_flush(self):
+        if len(self._saved) + len(self._failed) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Write everything queued so far in a single transaction. Returns rows written.
+
+        A saved bookmark whose description hash matches the stored content_hash only
+        has its scrape state updated; its skills and links are left as they are.
+        """
+        if not self._saved and not self._failed:
+            return 0
+
+        with self.conn:
+            unchanged = set()
+            for _, description_hash, url in self._saved:
+                row = self.conn.execute("SELECT content_hash FROM bookmarks WHERE url = ?", (url,)).fetchone()
+                if description_hash is not None and row and row[0] == description_hash:
+                    unchanged.add(url)
+            changed = [saved for saved in self._saved if saved[2] not in unchanged]
+            links = [link for link in self._links if link[0] not in unchanged]
+
+            self.conn.executemany('''
+                UPDATE bookmarks
+                SET last_scraped_at = datetime('now'), failure_count = 0, next_attempt_at = NULL
+                WHERE url = ?
+            ''', [(url,) for url in unchanged])
+            self.conn.executemany('''
+                UPDATE bookmarks
+                SET skills = ?, last_scraped_at = datetime('now'), content_hash = ?,
+                    failure_count = 0, next_attempt_at = NULL
+                WHERE url = ?
+            ''', changed)
+
+            # Replace each changed bookmark's skill links
+            self.conn.executemany("INSERT OR IGNORE INTO skills (name) VALUES (?)",
+                                  {(name,) for _, name in links})
+            self.conn.executemany(
+                "DELETE FROM bookmark_skills WHERE bookmark_id IN (SELECT id FROM bookmarks WHERE url = ?)",
+                [(url,) for _, _, url in changed]
+            )
+            self.conn.executemany('''
+                INSERT OR IGNORE INTO bookmark_skills (bookmark_id, skill_id)
+                SELECT b.id, s.id FROM bookmarks b, skills s WHERE b.url = ? AND s.name = ?
+            ''', links)
+
+            # Backoff doubles with every consecutive failure; the shift is capped to avoid overflow
+            self.conn.executemany('''
+                UPDATE bookmarks
+                SET next_attempt_at = datetime('now', '+' || min(? * (1 << min(COALESCE(failure_count, 0), 20)), ?) || ' seconds'),
+                    failure_count = COALESCE(failure_count, 0) + 1
+                WHERE url = ?
+            ''', [(RETRY_BASE_SECONDS, RETRY_MAX_SECONDS, url) for url in self._failed])
+
+            if self.run_id is not None:
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO scrape_checkpoints (run_id, url, status) VALUES (?, ?, ?)",
+                    [(self.run_id, url, "done") for _, _, url in self._saved]
+                )
+
+        written = len(self._saved) + len(self._failed)
+        self.unchanged += len(unchanged)
+        self._saved.clear()
+        self._links.clear()
+        self._failed.clear()
+        return written
+
+    def close(self):
+        self.flush()
+
+def fetch_skills_per_url(conn):
+    """Map every bookmark URL with extracted skills to its set of skill names."""
+    skills_per_url = {}
+    for url, name in conn.execute('''
+        SELECT b.url, s.name
+        FROM bookmark_skills bs
+        JOIN bookmarks b ON b.id = bs.bookmark_id
+        JOIN skills s ON s.id = bs.skill_id
+    '''):
+        skills_per_url.setdefault(url, set()).add(name)
+    return skills_per_url
+
+def fetch_urls_requiring(conn, skill):
+    """URLs of bookmarked jobs that list `skill`, answered from the skill -> bookmark index."""
+    cursor = conn.execute('''
+        SELECT b.url
+        FROM skills s
+        JOIN bookmark_skills bs ON bs.skill_id = s.id
+        JOIN bookmarks b ON b.id = bs.bookmark_id
+        WHERE s.name = ?
+    ''', (normalize_skill(skill),))
+    return [row[0] for row in cursor.fetchall()]
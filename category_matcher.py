@@ -0,0 +1,62 @@
+from collections import deque
+
+class MultiPatternMatcher:
+    """
+    Aho-Corasick automaton answering "does the text contain any of the patterns?"
+    in a single pass over the text, however many patterns there are.
+
+    Patterns are matched verbatim (case-sensitive), exactly like `pattern in text`.
+    """
+
+    def __init__(self, patterns):
+        # State 0 is the root; each state has its transitions, failure link and a match flag
+        self._goto = [{}]
+        self._fail = [0]
+        self._match = [False]
+
+        for pattern in patterns:
+            if not pattern:
+                # The empty string is contained in every text
+                self._match[0] = True
+                continue
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._match.append(False)
+                    self._goto[state][char] = next_state
+                state = next_state
+            self._match[state] = True
+
+        # Breadth-first pass to fill failure links and inherit matches along them
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                if self._match[self._fail[next_state]]:
+                    self._match[next_state] = True
+
+    def contains_any(self, text):
+        """True if any pattern occurs as a substring of text."""
+        goto = self._goto
+        fail = self._fail
+        match = self._match
+        if match[0]:
+            return True
+
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if match[state]:
+                return True
+        return False
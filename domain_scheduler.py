@@ -0,0 +1,154 @@
+import time
+import concurrent.futures
+from collections import deque, defaultdict
+from urllib.parse import urlparse
+
+# Per-site overrides of (max concurrent requests, min seconds between request starts)
+DOMAIN_POLICIES = {
+    "linkedin.com": (1, 3.0),
+    "indeed.com": (1, 2.0),
+    "glassdoor.com": (1, 2.0),
+}
+
+class DomainStats:
+    """Counters for one domain over a scheduler run."""
+
+    def __init__(self):
+        self.completed = 0
+        self.failed = 0
+        self.retries = 0
+        self.wait_time = 0.0  # Seconds URLs were ready but waiting to start
+        self.first_start = None
+        self.last_finish = None
+
+    def throughput(self):
+        """Completed URLs per second between the first start and the last finish."""
+        if self.first_start is None or self.last_finish is None or self.last_finish <= self.first_start:
+            return 0.0
+        return self.completed / (self.last_finish - self.first_start)
+
+
+class DomainScheduler:
+    """
+    Runs one task per URL on a thread pool while being polite to each host.
+
+    URLs are grouped by netloc. Each domain gets at most `per_domain` tasks in
+    flight and `min_delay` seconds between task starts (see DOMAIN_POLICIES for
+    overrides). Domains are served round-robin so a batch dominated by one host
+    does not starve the others. Tasks raising one of `transient_errors` are
+    retried up to `max_retries` times with exponential backoff.
+    """
+
+    def __init__(self, max_workers=4, per_domain=2, min_delay=1.0, max_retries=2, backoff=2.0,
+                 transient_errors=(Exception,), policies=DOMAIN_POLICIES):
+        self.max_workers = max_workers
+        self.per_domain = per_domain
+        self.min_delay = min_delay
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.transient_errors = transient_errors
+        self.policies = policies
+        self.stats = defaultdict(DomainStats)
+
+    def policy(self, domain):
+        """(max concurrent, min delay) for a domain."""
+        for site, policy in self.policies.items():
+            if site in domain:
+                return policy
+        return self.per_domain, self.min_delay
+
+    def run(self, urls, task):
+        """
+        Run task(url) for every URL and yield (url, result, error) as each one finishes.
+        `error` is None on success, otherwise the last exception raised.
+        """
+        queues = defaultdict(deque)  # domain -> deque of (url, attempt, ready_at)
+        now = time.monotonic()
+        for url in urls:
+            queues[urlparse(url).netloc].append((url, 0, now))
+
+        domains = deque(queues)  # Round-robin order
+        in_flight = defaultdict(int)
+        next_start = defaultdict(float)
+        running = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while running or any(queues.values()):
+                now = time.monotonic()
+
+                # Hand out work, one URL per eligible domain per pass, until the workers are busy
+                dispatched = True
+                while dispatched and len(running) < self.max_workers:
+                    dispatched = False
+                    for _ in range(len(domains)):
+                        domain = domains[0]
+                        domains.rotate(-1)
+                        queue = queues[domain]
+                        limit, delay = self.policy(domain)
+                        if not queue or queue[0][2] > now:
+                            continue
+                        if in_flight[domain] >= limit or next_start[domain] > now:
+                            continue
+
+                        url, attempt, ready_at = queue.popleft()
+                        stats = self.stats[domain]
+                        stats.wait_time += now - ready_at
+                        if stats.first_start is None:
+                            stats.first_start = now
+                        in_flight[domain] += 1
+                        next_start[domain] = now + delay
+                        running[executor.submit(task, url)] = (url, domain, attempt)
+                        dispatched = True
+                        break
+
+                # Sleep until a task finishes or the next URL becomes eligible
+                wake_times = []
+                if len(running) < self.max_workers:
+                    wake_times = [
+                        max(queue[0][2], next_start[domain])
+                        for domain, queue in queues.items()
+                        if queue and in_flight[domain] < self.policy(domain)[0]
+                    ]
+                timeout = max(0.0, min(wake_times) - now) if wake_times else None
+                if not running:
+                    time.sleep(timeout or 0)
+                    continue
+                done, _ = concurrent.futures.wait(
+                    running, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+
+                for future in done:
+                    url, domain, attempt = running.pop(future)
+                    in_flight[domain] -= 1
+                    stats = self.stats[domain]
+                    finished = time.monotonic()
+                    try:
+                        result = future.result()
+                    except self.transient_errors as e:
+                        if attempt < self.max_retries:
+                            stats.retries += 1
+                            retry_at = finished + self.backoff * (2 ** attempt)
+                            queues[domain].append((url, attempt + 1, retry_at))
+                            print(f"Retrying {url} in {retry_at - finished:.1f}s after: {e}")
+                            continue
+                        stats.failed += 1
+                        stats.last_finish = finished
+                        yield url, None, e
+                        continue
+                    except Exception as e:
+                        stats.failed += 1
+                        stats.last_finish = finished
+                        yield url, None, e
+                        continue
+
+                    stats.completed += 1
+                    stats.last_finish = finished
+                    yield url, result, None
+
+    def report(self):
+        """One line per domain with throughput, waiting time and failures."""
+        return [
+            f"{domain}: {stats.completed} done, {stats.failed} failed, {stats.retries} retries, "
+            f"{stats.throughput():.2f} pages/s, waited {stats.wait_time:.1f}s"
+            for domain, stats in sorted(self.stats.items())
+        ]
@@ -0,0 +1,106 @@
+import queue
+import threading
+from contextlib import contextmanager
+from selenium.common.exceptions import InvalidSessionIdException, NoSuchWindowException, WebDriverException # type: ignore
+from webdriver_manager.chrome import ChromeDriverManager # type: ignore
+
+# Resolved chromedriver binary, shared by every browser started in this process
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+def get_driver_path():
+    """Resolve the chromedriver binary once per process and reuse it."""
+    global _driver_path
+    if _driver_path is None:
+        with _driver_path_lock:
+            if _driver_path is None:
+                _driver_path = ChromeDriverManager().install()
+    return _driver_path
+
+
+# Errors after which the browser session cannot be used again
+SESSION_DEAD_ERRORS = (InvalidSessionIdException, NoSuchWindowException)
+
+def _is_alive(driver):
+    """Health check: the session still answers a cheap command."""
+    try:
+        driver.current_window_handle
+        return True
+    except WebDriverException:
+        return False
+
+
+class _PooledDriver:
+    """A browser slot in the pool together with the number of pages it has served."""
+
+    def __init__(self):
+        self.driver = None
+        self.pages = 0
+
+
+class DriverPool:
+    """
+    Bounded pool of long-lived WebDriver instances, one per worker.
+
+    Browsers are started lazily by `factory`, checked out with `driver()` and
+    returned to the pool after each page. A browser is restarted after it has
+    served `max_pages` pages or when the page it was handling left its session
+    dead; page-level errors (load timeouts, script errors) keep the browser.
+    """
+
+    def __init__(self, factory, size=4, max_pages=50):
+        self.factory = factory
+        self.size = size
+        self.max_pages = max_pages
+        self._slots = queue.Queue()
+        self._closed = False
+        for _ in range(size):
+            self._slots.put(_PooledDriver())
+
+    @contextmanager
+    def driver(self):
+        """Check out a browser for one page, blocking until a slot is free."""
+        if self._closed:
+            raise RuntimeError("DriverPool is closed")
+
+        slot = self._slots.get()
+        try:
+            if slot.driver is None:
+                slot.driver = self.factory()
+                slot.pages = 0
+
+            try:
+                yield slot.driver
+            except WebDriverException as e:
+                # Only a dead session needs a new browser; a slow page or failed script does not
+                if isinstance(e, SESSION_DEAD_ERRORS) or not _is_alive(slot.driver):
+                    self._retire(slot)
+                raise
+
+            slot.pages += 1
+            if slot.pages >= self.max_pages:
+                self._retire(slot)
+        finally:
+            self._slots.put(slot)
+
+    def _retire(self, slot):
+        """Quit the browser held by a slot so the next checkout starts a new one."""
+        if slot.driver is not None:
+            try:
+                slot.driver.quit()
+            except Exception:
+                pass
+        slot.driver = None
+        slot.pages = 0
+
+    def close(self):
+        """Quit every browser in the pool."""
+        self._closed = True
+        for _ in range(self.size):
+            self._retire(self._slots.get())
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
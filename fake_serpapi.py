@@ -0,0 +1,88 @@
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+# Sites the fake results link to, so app_four's LeetCode/Forage split has something to sort
+RESULT_SITES = ("leetcode.com/problems", "theforage.com/virtual-internships", "coursera.org/learn",
+                "udemy.com/course", "freecodecamp.org/news")
+
+def fake_results(query, num, fetch_number):
+    """Deterministic organic results for a query; fetch_number shows when a result was refreshed."""
+    slug = "-".join(word for word in query.lower().split() if word.isalnum())[:60] or "search"
+    return [
+        {
+            "position": position + 1,
+            "title": f"{query} resource {position + 1} (fetch {fetch_number})",
+            "link": f"https://www.{RESULT_SITES[position % len(RESULT_SITES)]}/{slug}-{position + 1}",
+        }
+        for position in range(num)
+    ]
+
+
+class _FakeSerpApiHandler(BaseHTTPRequestHandler):
+    """Answers /search like SerpAPI's JSON output, without logging every request."""
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        server = self.server
+
+        if parsed.path != "/search" or "q" not in params:
+            body, status = {"error": "Missing query `q` parameter."}, 400
+        else:
+            with server.lock:
+                server.request_count += 1
+                server.query_counts[params["q"]] += 1
+                fetch_number = server.query_counts[params["q"]]
+            if server.delay:
+                time.sleep(server.delay)
+            num = int(params.get("num", 10))
+            body = {
+                "search_metadata": {"status": "Success", "fake": True},
+                "search_parameters": {key: value for key, value in params.items() if key != "api_key"},
+                "organic_results": fake_results(params["q"], num, fetch_number),
+            }
+            status = 200
+
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def start_fake_serpapi(port=0, delay=0.0):
+    """
+    Start a local stand-in for serpapi.com in a background thread.
+
+    Returns (server, base_url); pass base_url as SERPAPI_BACKEND (or to
+    serp_cache.serpapi_backend) and call server.shutdown() when done.
+    server.request_count and server.query_counts count the searches served;
+    `delay` seconds are added to each search to make overlapping calls easy to test.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), _FakeSerpApiHandler)
+    server.lock = threading.Lock()
+    server.request_count = 0
+    server.query_counts = Counter()
+    server.delay = delay
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+if __name__ == "__main__":
+    # Serve until interrupted, e.g. for `SERPAPI_BACKEND=http://127.0.0.1:5099 python app_four.py`
+    port = int(sys.argv[1]) if len(sys.argv) > 1 else 5099
+    server, base_url = start_fake_serpapi(port)
+    print(f"Fake SerpAPI listening at {base_url}/search")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
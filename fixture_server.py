@@ -0,0 +1,48 @@
+import os
+import sys
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+# Static job pages used to exercise the scrapers without network access
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pages")
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    """Serves fixture files without logging every request to stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+def start_fixture_server(port=0, directory=FIXTURE_DIR):
+    """
+    Start a local HTTP server for the fixture pages in a background thread.
+
+    Returns (server, base_url); call server.shutdown() when done. With port=0
+    a free port is picked automatically.
+    """
+    handler = partial(_QuietHandler, directory=directory)
+    server = ThreadingHTTPServer(("127.0.0.1", port), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+def fixture_urls(base_url, directory=FIXTURE_DIR):
+    """URLs for every fixture page served under base_url."""
+    return [f"{base_url}/{name}" for name in sorted(os.listdir(directory)) if name.endswith(".html")]
+
+if __name__ == "__main__":
+    # Scrape the fixture pages end to end, e.g. `python fixture_server.py --http-only`
+    server, base_url = start_fixture_server()
+    print(f"Serving fixtures from {FIXTURE_DIR} at {base_url}")
+    try:
+        urls = fixture_urls(base_url)
+        if "--http-only" in sys.argv:
+            from http_fetch import fetch_page
+            for url in urls:
+                title, description = fetch_page(url)
+                print(f"\n{url}\nTitle: {title}\nDescription: {description}")
+        else:
+            from job_Des import extract_job_descriptions_parallel
+            extract_job_descriptions_parallel(urls, max_workers=2)
+    finally:
+        server.shutdown()
@@ -0,0 +1,135 @@
+import threading
+from collections import Counter
+import requests # type: ignore
+from requests.adapters import HTTPAdapter # type: ignore
+import lxml.html # type: ignore
+from lxml.etree import ParserError, XPathError # type: ignore
+from selenium.webdriver.common.by import By # type: ignore
+from urllib.parse import urlparse
+from job_selectors import get_ordered_selectors, selector_stats, MIN_TITLE_LENGTH, MIN_DESCRIPTION_LENGTH
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/98.0.4758.102 Safari/537.36"
+
+# Elements that start a new line in the rendered text, roughly like innerText
+BLOCK_TAGS = (
+    "address", "article", "aside", "blockquote", "br", "dd", "div", "dl", "dt",
+    "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "header", "hr", "li",
+    "main", "nav", "ol", "p", "pre", "section", "table", "tr", "ul",
+)
+
+# One pooled HTTP client shared by every scraper thread
+_session = requests.Session()
+_session.headers.update({"User-Agent": USER_AGENT})
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+_session.mount("http://", _adapter)
+_session.mount("https://", _adapter)
+
+
+class FetchStats:
+    """Thread-safe per-run counters of how each URL was fetched."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = Counter()
+
+    def record(self, path):
+        with self._lock:
+            self.counts[path] += 1
+
+    def summary(self):
+        return (
+            f"Cached: {self.counts['cache']}, Fast path (HTTP): {self.counts['http']}, "
+            f"Selenium fallback: {self.counts['selenium']}"
+        )
+
+
+def fetch_html(job_url, timeout=10):
+    """Fetch the initial HTML of a page, returning None on any HTTP error."""
+    try:
+        response = _session.get(job_url, timeout=timeout)
+        response.raise_for_status()
+        return response.text
+    except requests.RequestException as e:
+        print(f"HTTP fetch failed for {job_url}: {e}")
+        return None
+
+
+def _select(root, selector_type, selector):
+    """Evaluate one Selenium-style (By, selector) pair against an lxml tree."""
+    if selector_type == By.CSS_SELECTOR:
+        return root.cssselect(selector)
+    if selector_type == By.ID:
+        return root.xpath("//*[@id=$id]", id=selector)
+    if selector_type == By.TAG_NAME:
+        return root.xpath(f"//{selector}")
+    if selector_type == By.XPATH:
+        return root.xpath(selector)
+    return []
+
+
+def _element_text(element):
+    """Visible text of an element with block elements on their own lines."""
+    for block in element.iter(*BLOCK_TAGS):
+        block.tail = "\n" + (block.tail or "")
+    lines = (" ".join(line.split()) for line in element.text_content().split("\n"))
+    return "\n".join(line for line in lines if line)
+
+
+def extract_from_html(html, job_url, pending_stats=None):
+    """
+    Parse page HTML and return (title, description) using the same
+    per-domain selectors as the Selenium scraper. The selectors evaluated
+    before the first match are recorded in `selector_stats`, or, when a
+    `pending_stats` list is given, appended to it as selector_stats.record()
+    arguments for the caller to record once it knows this attempt is final.
+    """
+    try:
+        root = lxml.html.fromstring(html)
+    except (ParserError, ValueError):
+        return None, None
+
+    # Script and style contents are not part of the visible text
+    for element in root.xpath("//script | //style | //noscript"):
+        element.drop_tree()
+
+    domain = urlparse(job_url).netloc
+    title_selectors, selectors = get_ordered_selectors(domain)
+    job_title, title_matched = _first_match(root, title_selectors, MIN_TITLE_LENGTH)
+    # No whole-page fallback here: a missing description means escalating to Selenium
+    description, description_matched = _first_match(root, selectors, MIN_DESCRIPTION_LENGTH)
+
+    records = [(domain, "title", title_selectors, title_matched),
+               (domain, "description", selectors, description_matched)]
+    if pending_stats is None:
+        for record in records:
+            selector_stats.record(*record)
+    else:
+        pending_stats.extend(records)
+    return job_title, description
+
+
+def _first_match(root, selectors, min_length):
+    """
+    Text of the first selector matching an element with more than min_length
+    characters, and whether each selector tried up to that one matched.
+    """
+    matched = []
+    for selector_type, selector in selectors:
+        try:
+            elements = _select(root, selector_type, selector)
+        except XPathError:
+            matched.append(False)
+            continue
+        text = _element_text(elements[0]) if elements else ""
+        matched.append(len(text) > min_length)
+        if matched[-1]:
+            return text, matched
+    return None, matched
+
+
+def fetch_page(job_url, timeout=10, pending_stats=None):
+    """Fetch a page over plain HTTP and return its (title, description)."""
+    html = fetch_html(job_url, timeout=timeout)
+    if not html:
+        return None, None
+    return extract_from_html(html, job_url, pending_stats)
@@ -1,115 +1,37 @@
 from selenium import webdriver # type: ignore
-from selenium.webdriver.common.by import By # type: ignore
 from selenium.webdriver.chrome.service import Service # type: ignore
 from selenium.webdriver.chrome.options import Options # type: ignore
 from selenium.webdriver.support.ui import WebDriverWait # type: ignore
 from selenium.webdriver.support import expected_conditions as EC # type: ignore
-from selenium.common.exceptions import TimeoutException, NoSuchElementException # type: ignore
-from webdriver_manager.chrome import ChromeDriverManager # type: ignore
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException # type: ignore
+from driver_pool import DriverPool, get_driver_path
+from domain_scheduler import DomainScheduler
+from http_fetch import FetchStats, fetch_page
+from taxonomy import get_taxonomy
+from job_selectors import get_ordered_selectors, selector_stats, MIN_TITLE_LENGTH, MIN_DESCRIPTION_LENGTH
 import time
 from urllib.parse import urlparse
-import concurrent.futures
-import spacy # type: ignore
 from collections import Counter
-import nltk # type: ignore
-from nltk.corpus import stopwords # type: ignore
+from functools import lru_cache
+from nlp_resources import get_nlp, get_stopwords
 import sqlite3
 import time
 import sys
 
-# Load spaCy NLP model for keyword extraction
-nlp = spacy.load("en_core_web_sm")
-# Download stopwords once
-nltk.download("stopwords")
-
-# NLTK's predefined stopwords list
-nltk_stopwords = set(stopwords.words("english"))
-
-# Enhanced custom stop words list (job-related terms and common noise)
-custom_stopwords = {
-    # General job terms
-    "job", "work", "company", "description", "role", "team", "experience", 
-    "skills", "requirements", "years", "apply", "responsibilities", 
-    "looking", "jobs", "position", "opportunity", "candidate", 
-    "industry", "field", "type", "location", "join", "hire", "hiring",
-    "please", "email", "contact", "website", "http", "https", "com", "www",
-    
-    # Common noise words
-    "ability", "including", "within", "across", "including", "including",
-    "etc", "e.g", "i.e", "including", "including", "including", "including",
-    "strong", "excellent", "good", "understanding", "knowledge", "level",
-    "new", "use", "using", "used", "high", "quality", "various", "multiple",
-    "day", "days", "time", "times", "year", "years", "month", "months",
-    "need", "needs", "required", "requirement", "requirements", "skill",
-    
-    # Pronouns and determiners
-    "you", "your", "we", "our", "us", "they", "their", "them", "this", "that",
-    "these", "those", "some", "any", "all", "both", "either", "neither",
-    
-    # Common verbs
-    "have", "has", "had", "do", "does", "did", "make", "makes", "made",
-    "take", "takes", "took", "give", "gives", "gave", "get", "gets", "got",
-    "need", "needs", "want", "wants", "like", "likes", "prefer", "prefers"
-}
+def get_all_stopwords():
+    """NLTK's predefined stopwords merged with the taxonomy's custom and generic tech stopwords"""
+    return _merged_stopwords(get_taxonomy())
 
-# Technical terms that might be too generic
-generic_tech_terms = {
-    "system", "systems", "technology", "technologies", "process", "processes",
-    "method", "methods", "way", "ways", "thing", "things", "part", "parts",
-    "area", "areas", "aspect", "aspects", "component", "components"
-}
+@lru_cache(maxsize=2)
+def _merged_stopwords(taxonomy):
+    return get_stopwords("english").union(taxonomy.custom_stopwords).union(taxonomy.generic_tech_terms)
 
-# Merge all stopword sets
-all_stopwords = nltk_stopwords.union(custom_stopwords).union(generic_tech_terms)
-
-# List of valid job-related categories to keep
-JOB_RELATED_CATEGORIES = {
-    "programming", "design", "marketing", "analysis", "engineering",
-    "management", "development", "testing", "support", "administration",
-    "finance", "accounting", "sales", "writing", "content", "education",
-    "research", "science", "data", "security", "network", "cloud",
-    "database", "web", "mobile", "graphics", "video", "audio",
-    "architecture", "construction", "healthcare", "medical", "legal",
-    "hr", "human resources", "recruiting", "customer", "service",
-    "logistics", "supply chain", "manufacturing", "production",
-    
-    # Expanded Categories
-    "cybersecurity", "artificial intelligence", "machine learning",
-    "deep learning", "blockchain", "cryptocurrency", "biotechnology",
-    "genetics", "pharmaceutical", "robotics", "automation",
-    "environmental", "energy", "sustainability", "renewable energy",
-    "social media", "public relations", "advertising", "brand management",
-    "event planning", "hospitality", "tourism", "real estate",
-    "interior design", "fashion", "retail", "e-commerce",
-    "game development", "UI", "UX", "human-computer interaction",
-    "aerospace", "automotive", "transportation", "marine",
-    "quantitative analysis", "actuarial science", "investment",
-    "venture capital", "private equity", "banking", "insurance",
-    "legal compliance", "intellectual property", "regulatory affairs",
-    "nonprofit", "ngo", "policy", "government", "public administration",
-    "journalism", "publishing", "copywriting", "technical writing",
-    "psychology", "counseling", "therapy", "coaching", "fitness",
-    "sports management", "personal training", "nutrition",
-    "veterinary", "agriculture", "forestry", "horticulture",
-    "food science", "culinary", "restaurant", "catering",
-    "film", "television", "broadcasting", "photography",
-    "voice acting", "performing arts", "music", "theater",
-    "museum", "archival", "history", "anthropology", "archaeology",
-    "linguistics", "translation", "interpretation",
-    "military", "law enforcement", "forensics", "intelligence",
-    "emergency management", "firefighting", "paramedic",
-    "aviation", "air traffic control", "meteorology"
-}
-
-
-def is_job_related(term):
-    """Check if a term is job-related by comparing against known categories"""
-    term = term.lower()
-    return any(category in term for category in JOB_RELATED_CATEGORIES)
-
-def extract_section(text, section_keywords=("requirements", "skills", "qualifications", "what we're looking for", "key qualifications", "must-have", "responsibilities", "responsibility")):
+def extract_section(text, section_keywords=("requirements", "skills", "qualifications", "what we're looking for", "key qualifications", "must-have", "responsibilities", "responsibility"), doc=None):
     """
     Extracts specific sections from a job description based on section keywords.
+
+    `doc` is an already parsed Doc of the text (original case) whose sentences are
+    reused for the sentence fallback instead of parsing the text again.
     """
     lines = text.split("\n")
     extracted_text = []
@@ -132,7 +54,9 @@ def extract_section(text, section_keywords=("requirements", "skills", "qualifica
 
     # If no section was found, try to extract relevant sentences
     if not extracted_text:
-        sentences = [sent.text.strip() for sent in nlp(text).sents]
+        if doc is None:
+            doc = get_nlp()(text)
+        sentences = [sent.text.strip() for sent in doc.sents]
         for sentence in sentences:
             if any(keyword in sentence.lower() for keyword in section_keywords):
                 extracted_text.append(sentence)
@@ -146,13 +70,21 @@ def extract_keywords(text):
     if not text:  # Handle None or empty input
         return []
     
-    doc = nlp(text.lower())  # Convert text to lowercase
-    
+    return keywords_from_doc(get_nlp()(text))
+
+def keywords_from_doc(doc):
+    """
+    Extracts lowercased job-related keywords from a Doc parsed from the original
+    text, so the same Doc also serves extract_section's sentence fallback.
+    """
+    taxonomy = get_taxonomy()
+    all_stopwords = get_all_stopwords()
+
     # Extract nouns, proper nouns, and adjectives that are likely job-relevant
     keywords = []
     for token in doc:
         # Skip stopwords, short words, and non-alphabetic tokens
-        if (token.text in all_stopwords or 
+        if (token.lower_ in all_stopwords or 
             len(token.text) <= 2 or 
             not token.is_alpha):
             continue
@@ -161,11 +93,9 @@ def extract_keywords(text):
         if token.pos_ in ["NOUN", "PROPN"] or (
             token.pos_ == "ADJ" and any(child.pos_ in ["NOUN", "PROPN"] for child in token.children)
         ):
-            lemma = token.lemma_
-            
             # Only keep terms that are job-related
-            if is_job_related(lemma) or any(cat in lemma for cat in JOB_RELATED_CATEGORIES):
-                keywords.append(lemma)
+            if taxonomy.is_job_related_lemma(token.lemma_):
+                keywords.append(token.lemma_.lower())
     
     # Count occurrences and return top keywords
     keyword_freq = Counter(keywords)
@@ -173,11 +103,49 @@ def extract_keywords(text):
     # Filter out terms that appear only once unless they're clearly job-related
     top_keywords = [
         word for word, freq in keyword_freq.most_common(15)  # Get more candidates
-        if freq > 1 or is_job_related(word)
+        if freq > 1 or taxonomy.is_job_related(word)
     ][:10]  # Return top 10
     
     return top_keywords
 
+# Pipeline components the keyword extraction never looks at
+UNUSED_PIPES = ("ner",)
+
+def extract_keywords_batch(results, batch_size=32, n_process=1):
+    """
+    Fills the keyword fields of scraped results in place, after scraping.
+
+    Each description is parsed once by nlp.pipe, in batches; its Doc gives the
+    keywords and the sentences for extract_section's fallback, as in
+    build_job_result. The extracted requirements sections are then parsed in a
+    final batched pass.
+    """
+    scraped = [result for result in results.values() if result["description"]]
+    if not scraped:
+        return results
+
+    nlp = get_nlp()
+    disabled = [name for name in UNUSED_PIPES if name in nlp.pipe_names]
+
+    with nlp.select_pipes(disable=disabled):
+        docs = nlp.pipe(
+            (result["description"] for result in scraped),
+            batch_size=batch_size, n_process=n_process
+        )
+        for result, doc in zip(scraped, docs):
+            result["description_keywords"] = keywords_from_doc(doc)
+            result["requirements_text"] = extract_section(result["description"], doc=doc)
+
+        with_requirements = [result for result in scraped if result["requirements_text"]]
+        docs = nlp.pipe(
+            (result["requirements_text"] for result in with_requirements),
+            batch_size=batch_size, n_process=n_process
+        )
+        for result, doc in zip(with_requirements, docs):
+            result["requirements_keywords"] = keywords_from_doc(doc)
+
+    return results
+
 def setup_driver(headless=True):
     """
     Set up and return a configured Selenium WebDriver instance with optimized settings
@@ -203,74 +171,95 @@ def setup_driver(headless=True):
     chrome_options.set_capability("pageLoadStrategy", "eager")  # Don't wait for all resources
     
     # Initialize WebDriver with a shorter page load timeout
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+    driver = webdriver.Chrome(service=Service(get_driver_path()), options=chrome_options)
     driver.set_page_load_timeout(15)  # Shorter timeout
     
     return driver
 
-# [Previous imports remain the same...]
+# Checks every candidate selector in one browser round-trip.
+# Arguments: title selectors, description selectors, min title length, min description length.
+# Selector types are the string values of selenium's By constants.
+FIND_ALL_SELECTORS_JS = """
+const [titleSelectors, descriptionSelectors, minTitleLength, minDescriptionLength] = arguments;
+
+function find(type, selector) {
+    try {
+        if (type === "css selector") return document.querySelector(selector);
+        if (type === "id") return document.getElementById(selector);
+        if (type === "tag name") return document.getElementsByTagName(selector)[0] || null;
+        if (type === "xpath") {
+            return document.evaluate(selector, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+        }
+    } catch (e) {}
+    return null;
+}
+
+function scan(selectors, minLength) {
+    let text = null;
+    const matched = selectors.map(([type, selector]) => {
+        const element = find(type, selector);
+        const elementText = element ? (element.innerText || element.textContent || "").trim() : "";
+        const hit = elementText.length > minLength;
+        if (hit && text === null) text = elementText;
+        return hit;
+    });
+    return {matched: matched, text: text};
+}
+
+return {
+    title: scan(titleSelectors, minTitleLength),
+    description: scan(descriptionSelectors, minDescriptionLength)
+};
+"""
 
-def get_job_description(job_url):
+def find_with_single_script(driver, domain, title_selectors, selectors, deadline=5, poll_interval=0.25):
     """
-    Scrapes job descriptions and extracts job titles, descriptions, and job-related keywords.
+    Evaluates all title and description selectors at once, re-running the check
+    until a description appears or `deadline` seconds have passed. Records which
+    selectors matched in `selector_stats`.
     """
-    driver = None
-    try:
-        driver = setup_driver(headless=True)
-        driver.get(job_url)
-        time.sleep(1)
-
-        domain = urlparse(job_url).netloc
-        selectors = []
-        title_selectors = []
-
-        # Define selectors for both title and description based on domain
-        if "linkedin.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".show-more-less-html__markup"))
-            title_selectors.append((By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title"))
-        elif "indeed.com" in domain:
-            selectors.append((By.ID, "jobDescriptionText"))
-            title_selectors.append((By.CSS_SELECTOR, ".jobsearch-JobInfoHeader-title"))
-        elif "glassdoor.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".jobDescriptionContent"))
-            title_selectors.append((By.CSS_SELECTOR, "[data-test='job-title']"))
-        elif "monster.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".job-description"))
-            title_selectors.append((By.CSS_SELECTOR, ".job-title h1"))
-        elif "unstop.com" in domain:
-            selectors.append((By.XPATH, '//*[@id="tab-detail"]/div[1]/ul[1]'))
-            title_selectors.append((By.TAG_NAME, "h1"))
-        elif "internshala.com" in domain:
-            selectors.append((By.CSS_SELECTOR, ".internship_details"))
-            title_selectors.append((By.CSS_SELECTOR, ".profile_on_detail_page"))
-
-        # Additional fallback selectors for description
-        selectors.extend([
-            (By.CSS_SELECTOR, "div.job-description"),
-            (By.CSS_SELECTOR, ".description-container"),
-            (By.ID, "job-description"),
-            (By.XPATH, "//div[contains(@class, 'description')]"),
-        ])
-
-        # Additional fallback selectors for title
-        title_selectors.extend([
-            (By.CSS_SELECTOR, "h1.job-title"),
-            (By.CSS_SELECTOR, ".job-title"),
-            (By.CSS_SELECTOR, "h1.title"),
-            (By.XPATH, "//h1[contains(@class, 'title')]"),
-            (By.XPATH, "//h1[contains(text(), 'job') or contains(text(), 'position')]"),
-        ])
+    end_time = time.monotonic() + deadline
+    while True:
+        found = driver.execute_script(
+            FIND_ALL_SELECTORS_JS, title_selectors, selectors,
+            MIN_TITLE_LENGTH, MIN_DESCRIPTION_LENGTH
+        )
+        if found["description"]["text"] or time.monotonic() >= end_time:
+            break
+        time.sleep(poll_interval)
+
+    selector_stats.record(domain, "title", title_selectors, found["title"]["matched"])
+    selector_stats.record(domain, "description", selectors, found["description"]["matched"])
+    return found["title"]["text"], found["description"]["text"]
+
+def scrape_page(driver, job_url, single_shot=True, deadline=5):
+    """
+    Loads a job page in an existing browser and returns its (title, description).
+
+    In single-shot mode every selector is checked by one script under a single
+    `deadline`; otherwise each selector gets its own 3-second wait in turn.
+    """
+    driver.get(job_url)
+    time.sleep(1)
+
+    domain = urlparse(job_url).netloc
+    title_selectors, selectors = get_ordered_selectors(domain)
 
+    description = None
+    job_title = None
+
+    if single_shot:
+        job_title, description = find_with_single_script(driver, domain, title_selectors, selectors, deadline)
+    else:
         wait = WebDriverWait(driver, 3)
-        description = None
-        job_title = None
 
         # Try to extract job title
         for selector_type, selector in title_selectors:
             try:
                 element = wait.until(EC.presence_of_element_located((selector_type, selector)))
                 text = element.text.strip()
-                if len(text) > 3:  # Minimum length for a title
+                if len(text) > MIN_TITLE_LENGTH:  # Minimum length for a title
                     job_title = text
                     break
             except (TimeoutException, NoSuchElementException):
@@ -281,43 +270,106 @@ def get_job_description(job_url):
             try:
                 element = wait.until(EC.presence_of_element_located((selector_type, selector)))
                 text = element.text.strip()
-                if len(text) > 50:
+                if len(text) > MIN_DESCRIPTION_LENGTH:
                     description = text
                     break
             except (TimeoutException, NoSuchElementException):
                 continue
 
-        # Fallback: Extract main page text for description
-        if not description:
-            try:
-                description = driver.execute_script("return document.body.innerText;").strip()
-            except:
-                description = None
-
-        if description:
-            keywords = extract_keywords(description)  # Extract general keywords
-
-            # Extract "requirements/skills" section
-            requirements_text = extract_section(description)
-            requirements_keywords = extract_keywords(requirements_text) if requirements_text else []
-
-            return {
-                "title": job_title,
-                "description": description,
-                "description_keywords": keywords,
-                "requirements_text": requirements_text,
-                "requirements_keywords": requirements_keywords
-            }
+    # Fallback: Extract main page text for description
+    if not description:
+        try:
+            description = driver.execute_script("return document.body.innerText;").strip()
+        except:
+            description = None
+
+    return job_title, description
+
+def build_job_result(job_title, description, with_keywords=True):
+    """
+    Builds the result dict for a scraped page, extracting keywords from the description.
+
+    With `with_keywords=False` the keyword fields are left empty for extract_keywords_batch.
+    """
+    if description and not with_keywords:
+        return {
+            "title": job_title,
+            "description": description,
+            "description_keywords": [],
+            "requirements_text": None,
+            "requirements_keywords": []
+        }
+    elif description:
+        doc = get_nlp()(description)
+        keywords = keywords_from_doc(doc)  # Extract general keywords
+
+        # Extract "requirements/skills" section
+        requirements_text = extract_section(description, doc=doc)
+        requirements_keywords = extract_keywords(requirements_text) if requirements_text else []
+
+        return {
+            "title": job_title,
+            "description": description,
+            "description_keywords": keywords,
+            "requirements_text": requirements_text,
+            "requirements_keywords": requirements_keywords
+        }
+    else:
+        return {
+            "title": job_title,
+            "description": None, 
+            "description_keywords": [],
+            "requirements_text": None,
+            "requirements_keywords": []
+        }
+
+def get_job_description(job_url, pool=None, http_first=True, stats=None, single_shot=True, with_keywords=True,
+                        raise_errors=False):
+    """
+    Scrapes job descriptions and extracts job titles, descriptions, and job-related keywords.
+
+    With `http_first` the page is first fetched over plain HTTP; Selenium is only used
+    when that yields no description longer than MIN_DESCRIPTION_LENGTH. When a DriverPool
+    is given the page is loaded in one of its long-lived browsers, otherwise a fresh
+    browser is started and quit for this URL alone. `stats` (a FetchStats) records
+    which path was taken. `single_shot` selects how selectors are checked in the browser.
+    Selector stats are recorded once per URL, for the path that produced the result.
+    `with_keywords=False` skips keyword extraction so it can be batched later.
+    With `raise_errors` failures propagate (so a scheduler can retry them) instead of
+    producing an empty result.
+    """
+    try:
+        job_title = None
+        if http_first:
+            # Held back so an escalated page is not counted for both the HTTP and the browser attempt
+            http_selector_stats = []
+            job_title, description = fetch_page(job_url, pending_stats=http_selector_stats)
+            if description and len(description) > MIN_DESCRIPTION_LENGTH:
+                for record in http_selector_stats:
+                    selector_stats.record(*record)
+                if stats is not None:
+                    stats.record("http")
+                return build_job_result(job_title, description, with_keywords)
+
+        if stats is not None:
+            stats.record("selenium")
+
+        http_title = job_title
+        if pool is not None:
+            with pool.driver() as driver:
+                job_title, description = scrape_page(driver, job_url, single_shot)
         else:
-            return {
-                "title": job_title,
-                "description": None, 
-                "description_keywords": [],
-                "requirements_text": None,
-                "requirements_keywords": []
-            }
+            driver = setup_driver(headless=True)
+            try:
+                job_title, description = scrape_page(driver, job_url, single_shot)
+            finally:
+                driver.quit()
+
+        return build_job_result(job_title or http_title, description, with_keywords)
 
     except Exception as e:
+        if raise_errors:
+            raise
         print(f"⚠️ Error scraping {job_url}: {e}")
         return {
             "title": None,
@@ -326,44 +378,122 @@ def get_job_description(job_url):
             "requirements_text": None,
             "requirements_keywords": []
         }
-    finally:
-        if driver:
-            driver.quit()
 
-def process_url(url):
-    """Helper function for parallel processing"""
-    result = get_job_description(url)
-    return url, result  # Return the URL and the full result (description and keywords)
+# Errors worth retrying later: browser crashes/timeouts and dropped connections
+TRANSIENT_ERRORS = (WebDriverException, ConnectionError, TimeoutError)
+
+def process_url(url, pool=None, http_first=True, stats=None, single_shot=True):
+    """Helper function for parallel processing; keywords are extracted afterwards in one batch"""
+    return get_job_description(url, pool, http_first=http_first, stats=stats, single_shot=single_shot,
+                               with_keywords=False, raise_errors=True)
+
+def iter_job_descriptions(job_urls, max_workers=4, max_pages_per_driver=50, http_first=True, single_shot=True,
+                          cache=None, max_age=None, nlp_batch_size=32, nlp_processes=1, scheduler=None,
+                          chunk_size=1):
+    """
+    Scrape job URLs in parallel and yield (url, result) as results become available.
 
-def extract_job_descriptions_parallel(job_urls, max_workers=4):
+    Results are yielded in chunks of `chunk_size` once their keywords have been
+    extracted with one nlp.pipe batch per chunk, so callers can persist them while
+    the rest of the run is still scraping. The default chunk_size=1 yields every URL
+    as soon as it completes, so a crash loses at most the URLs still in flight; a
+    larger chunk batches the NLP at the cost of redoing that chunk after a crash. Other arguments are as for extract_job_descriptions_parallel.
+    """
+    stats = FetchStats()
+    chunk = {}
+    if cache is not None:
+        # Start from the selector hit rates learned in earlier runs
+        cache.load_selector_stats(selector_stats)
+
+    def flush():
+        extract_keywords_batch(chunk, batch_size=nlp_batch_size, n_process=nlp_processes)
+        completed = list(chunk.items())
+        chunk.clear()
+        return completed
+
+    # Serve fresh pages from the cache so they never reach a browser
+    pending_urls = []
+    for url in job_urls:
+        cached = cache.get(url, max_age) if cache is not None else None
+        if cached:
+            chunk[url] = build_job_result(cached["title"], cached["description"], with_keywords=False)
+            stats.record("cache")
+            print(f"Cached: {url}")
+            if len(chunk) >= chunk_size:
+                yield from flush()
+        else:
+            pending_urls.append(url)
+
+    if scheduler is None:
+        scheduler = DomainScheduler(max_workers=max_workers, transient_errors=TRANSIENT_ERRORS)
+
+    # One long-lived browser per worker, recycled between URLs
+    with DriverPool(setup_driver, size=scheduler.max_workers, max_pages=max_pages_per_driver) as pool:
+        task = lambda url: process_url(url, pool, http_first, stats, single_shot)
+
+        # The scheduler interleaves domains and yields results as they complete
+        for url, result, error in scheduler.run(pending_urls, task):
+            if error is not None:
+                print(f"⚠️ Error scraping {url}: {error}")
+                result = build_job_result(None, None)
+            if result["description"]:
+                if cache is not None:
+                    cache.put(url, result["title"], result["description"])
+                print(f"Scraped: {url}")
+            else:
+                print(f"Failed: {url}")
+
+            chunk[url] = result
+            if len(chunk) >= chunk_size:
+                yield from flush()
+
+    if chunk:
+        yield from flush()
+
+    if cache is not None:
+        cache.save_selector_stats(selector_stats)
+
+    print(stats.summary())
+    for line in scheduler.report():
+        print(line)
+    for line in selector_stats.summary():
+        print(line)
+
+def extract_job_descriptions_parallel(job_urls, max_workers=4, max_pages_per_driver=50, http_first=True, single_shot=True,
+                                      cache=None, max_age=None, nlp_batch_size=32, nlp_processes=1, scheduler=None):
     """
     Extract job descriptions in parallel for much faster execution
     
     Args:
         job_urls: List of job posting URLs
         max_workers: Maximum number of parallel browser instances
+        max_pages_per_driver: Pages a pooled browser serves before it is restarted
+        http_first: Try a plain HTTP fetch before falling back to Selenium
+        single_shot: Check all selectors in one browser script instead of one wait each
+        cache: Optional PageCache; fresh cached pages are never fetched again
+        max_age: Override the cache TTL in seconds (0 forces a refresh)
+        nlp_batch_size: Documents per nlp.pipe batch in the keyword stage
+        nlp_processes: Worker processes for nlp.pipe in the keyword stage
+        scheduler: DomainScheduler enforcing per-domain limits; one with defaults is created if None
         
     Returns:
         dict: Dictionary mapping URLs to their results (description and keywords)
     """
     results = {}
-    
-    # Use ThreadPoolExecutor for parallel processing
-    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all scraping tasks
-        future_to_url = {executor.submit(process_url, url): url for url in job_urls}
-        
-        # Process results as they complete
-        for future in concurrent.futures.as_completed(future_to_url):
-            url, result = future.result()
-            results[url] = result
-            if result["description"]:
-                print(f"Scraped: {url}")
-                print(f"Description Keywords: {result['description_keywords']}")
-                print(f"Requirements Keywords: {result['requirements_keywords']}")
-            else:
-                print(f"Failed: {url}")
-    
+
+    # Keywords are extracted once over every page after scraping, not inside scraper threads
+    for url, result in iter_job_descriptions(
+        job_urls, max_workers=max_workers, max_pages_per_driver=max_pages_per_driver,
+        http_first=http_first, single_shot=single_shot, cache=cache, max_age=max_age,
+        nlp_batch_size=nlp_batch_size, nlp_processes=nlp_processes, scheduler=scheduler,
+        chunk_size=max(len(job_urls), 1)
+    ):
+        results[url] = result
+        if result["description"]:
+            print(f"Keywords for {url}")
+            print(f"Description Keywords: {result['description_keywords']}")
+            print(f"Requirements Keywords: {result['requirements_keywords']}")
+
     return results
 
 """# Modified example usage to show title
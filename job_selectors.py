@@ -0,0 +1,150 @@
+import threading
+from collections import Counter
+from selenium.webdriver.common.by import By # type: ignore
+
+# Minimum lengths for extracted text to count as a real title / description
+MIN_TITLE_LENGTH = 3
+MIN_DESCRIPTION_LENGTH = 50
+
+# Generic fallbacks, always tried after a domain's own selectors
+FALLBACK_SELECTORS = [
+    (By.CSS_SELECTOR, "div.job-description"),
+    (By.CSS_SELECTOR, ".description-container"),
+    (By.ID, "job-description"),
+    (By.XPATH, "//div[contains(@class, 'description')]"),
+]
+FALLBACK_TITLE_SELECTORS = [
+    (By.CSS_SELECTOR, "h1.job-title"),
+    (By.CSS_SELECTOR, ".job-title"),
+    (By.CSS_SELECTOR, "h1.title"),
+    (By.XPATH, "//h1[contains(@class, 'title')]"),
+    (By.XPATH, "//h1[contains(text(), 'job') or contains(text(), 'position')]"),
+]
+
+def get_domain_selectors(domain):
+    """Returns the (title_selectors, selectors) specific to job pages on `domain`, possibly empty."""
+    selectors = []
+    title_selectors = []
+
+    # Define selectors for both title and description based on domain
+    if "linkedin.com" in domain:
+        selectors.append((By.CSS_SELECTOR, ".show-more-less-html__markup"))
+        title_selectors.append((By.CSS_SELECTOR, ".job-details-jobs-unified-top-card__job-title"))
+    elif "indeed.com" in domain:
+        selectors.append((By.ID, "jobDescriptionText"))
+        title_selectors.append((By.CSS_SELECTOR, ".jobsearch-JobInfoHeader-title"))
+    elif "glassdoor.com" in domain:
+        selectors.append((By.CSS_SELECTOR, ".jobDescriptionContent"))
+        title_selectors.append((By.CSS_SELECTOR, "[data-test='job-title']"))
+    elif "monster.com" in domain:
+        selectors.append((By.CSS_SELECTOR, ".job-description"))
+        title_selectors.append((By.CSS_SELECTOR, ".job-title h1"))
+    elif "unstop.com" in domain:
+        selectors.append((By.XPATH, '//*[@id="tab-detail"]/div[1]/ul[1]'))
+        title_selectors.append((By.TAG_NAME, "h1"))
+    elif "internshala.com" in domain:
+        selectors.append((By.CSS_SELECTOR, ".internship_details"))
+        title_selectors.append((By.CSS_SELECTOR, ".profile_on_detail_page"))
+
+    return title_selectors, selectors
+
+def get_selectors(domain):
+    """
+    Returns the (title_selectors, selectors) to try for a job page on `domain`,
+    domain-specific ones first followed by the generic fallbacks.
+    """
+    title_selectors, selectors = get_domain_selectors(domain)
+    return title_selectors + FALLBACK_TITLE_SELECTORS, selectors + FALLBACK_SELECTORS
+
+class SelectorStats:
+    """
+    Thread-safe per-domain hit rates of title and description selectors.
+
+    `kind` is "title" or "description"; a hit means the selector matched an
+    element with enough text on the page. restore() and take_unsaved() let a
+    store (see PageCache) keep the counts across runs.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.attempts = Counter()
+        self.hits = Counter()
+        self._saved_attempts = Counter()
+        self._saved_hits = Counter()
+
+    def restore(self, rows):
+        """Replace the counts with stored (domain, kind, selector_type, selector, attempts, hits) rows."""
+        with self._lock:
+            self.attempts = Counter()
+            self.hits = Counter()
+            for domain, kind, selector_type, selector, attempts, hits in rows:
+                key = (domain, kind, (selector_type, selector))
+                self.attempts[key] = attempts
+                self.hits[key] = hits
+            self._saved_attempts = self.attempts.copy()
+            self._saved_hits = self.hits.copy()
+
+    def take_unsaved(self):
+        """Counts recorded since the last restore() or take_unsaved(), as rows like restore() takes."""
+        rows = []
+        with self._lock:
+            for key, attempts in self.attempts.items():
+                new_attempts = attempts - self._saved_attempts[key]
+                if new_attempts > 0:
+                    domain, kind, (selector_type, selector) = key
+                    rows.append((domain, kind, selector_type, selector,
+                                 new_attempts, self.hits[key] - self._saved_hits[key]))
+            self._saved_attempts = self.attempts.copy()
+            self._saved_hits = self.hits.copy()
+        return rows
+
+    def record(self, domain, kind, selectors, matched):
+        """
+        Record one page's outcome for every selector that was evaluated;
+        `matched` may be shorter than `selectors` when the search stopped early.
+        """
+        with self._lock:
+            for selector, hit in zip(selectors, matched):
+                key = (domain, kind, selector)
+                self.attempts[key] += 1
+                if hit:
+                    self.hits[key] += 1
+
+    def hit_rate(self, domain, kind, selector):
+        key = (domain, kind, selector)
+        attempts = self.attempts[key]
+        return self.hits[key] / attempts if attempts else 0.0
+
+    def order(self, domain, kind, selectors):
+        """Selectors sorted by hit rate on this domain, keeping the default order on ties."""
+        with self._lock:
+            return sorted(selectors, key=lambda selector: -self.hit_rate(domain, kind, selector))
+
+    def summary(self):
+        """One line per (domain, kind) naming its most successful selector."""
+        best = {}
+        with self._lock:
+            for (domain, kind, selector), attempts in self.attempts.items():
+                rate = self.hit_rate(domain, kind, selector)
+                if rate > best.get((domain, kind), (None, -1.0, 0))[1]:
+                    best[(domain, kind)] = (selector, rate, attempts)
+        return [
+            f"{domain} {kind}: {selector[1]!r} hit {rate:.0%} of {attempts} pages"
+            for (domain, kind), (selector, rate, attempts) in sorted(best.items())
+        ]
+
+# Shared by every scraper thread in this process
+selector_stats = SelectorStats()
+
+def get_ordered_selectors(domain):
+    """
+    get_selectors() with the most successful selectors for this domain tried first.
+    Domain-specific selectors always stay ahead of the generic fallbacks.
+    """
+    title_selectors, selectors = get_domain_selectors(domain)
+    return (
+        selector_stats.order(domain, "title", title_selectors)
+        + selector_stats.order(domain, "title", FALLBACK_TITLE_SELECTORS),
+        selector_stats.order(domain, "description", selectors)
+        + selector_stats.order(domain, "description", FALLBACK_SELECTORS),
+    )
@@ -1,9 +1,15 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
 import re
+import sys
 from datetime import datetime
 
+# Company names and job roles come from the shared taxonomy in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from taxonomy import get_taxonomy
+
 def parse_message(message):
     """Extract job application details from an email message."""
     try:
@@ -44,24 +50,11 @@ def parse_message(message):
 
 def extract_company(sender, subject, body):
     """Extract company name from email metadata and content, with platform filtering and debug logs."""
-    # Known companies to look for specifically
-    known_companies = [
-        "Agron Remedies Private Limited",
-        "Sea",
-        "Google",
-        "Goldman Sachs",
-        "SIP Check",
-        "Latracal Solutions Pvt Ltd",
-        "CBIT Open Source Community",
-        "Girl Hackathon",
-        "My Peoples Card"
-    ]
-    
-    # First check if any known company is mentioned directly in the body
-    for company in known_companies:
-        if company.lower() in body.lower():
-            print(f"🎯 Found exact company match: {company}")
-            return company
+    # First check if any known company from the taxonomy is mentioned directly in the body
+    company = get_taxonomy().find_company(body)
+    if company:
+        print(f"🎯 Found exact company match: {company}")
+        return company
     
     platforms = ['linkedin', 'unstop', 'naukri', 'instahyre', 'foundit', 'indeed']
     
@@ -131,32 +124,14 @@ def extract_company(sender, subject, body):
 
 def extract_role(subject, body):
     """Extract job role from email subject and body using keyword search."""
-    # List of potential job roles (you can extend this list as needed)
-    job_roles = [
-        "Data Scientist", "Data Analyst", "Full Stack Developer", "Software Engineer", "Website Developer", "Developer", 
-        "Summer Analyst", "Designer", "Manager", "Consultant", "AI Researcher", 
-        "Intern", "Business Analyst", "Frontend Developer", 
-        "Backend Developer", 
-    ]
+    # Roles (and their aliases) from the taxonomy found in the subject or the body, in one scan each
+    taxonomy = get_taxonomy()
+    found = taxonomy.find_roles(subject) | taxonomy.find_roles(body)
     
-    # Convert the subject and body to lowercase to ensure case-insensitive matching
-    subject_lower = subject.lower()
-    body_lower = body.lower()
-
-    # Loop through each job role keyword and search in the subject
-    for role in job_roles:
-        # Create a regex pattern for each job role (case-insensitive search)
-        pattern = re.escape(role.lower())  # escape special characters in role
-        
-        # Check if role is in the subject
-        match = re.search(pattern, subject_lower)
-        if match:
-            return role  # return role in its original case (as listed in job_roles)
-        
-        # If not found in the subject, check in the body
-        match = re.search(pattern, body_lower)
-        if match:
-            return role  # return role in its original case (as listed in job_roles)
+    # The first role in taxonomy order wins, in its original case
+    for role in taxonomy.job_roles:
+        if role in found:
+            return role
 
     # Default if no match is found
     return "Unknown Role"
@@ -1,73 +1,137 @@
-import sqlite3
 import time
 import sys
-from job_Des import extract_job_descriptions_parallel  # Import your function
-
-def fetch_job_urls():
-    """Fetch job URLs from the SQLite database."""
-    conn = sqlite3.connect("bookmarks.db")  # Ensure this is the correct database name
+import argparse
+import hashlib
+from job_Des import iter_job_descriptions  # Import your function
+from page_cache import PageCache, DEFAULT_CACHE_PATH, DEFAULT_TTL, DEFAULT_MAX_BYTES
+from bookmarks_store import BookmarkWriter, connect, ensure_schema
+from nlp_resources import MissingNLPDataError, load_nlp_resources
+
+# Incremental mode: re-scrape bookmarks after this long
+DEFAULT_STALE_AFTER_HOURS = 7 * 24
+
+def fetch_job_urls(conn, incremental=False, stale_after_hours=DEFAULT_STALE_AFTER_HOURS):
+    """
+    Fetch job URLs from the SQLite database.
+
+    In incremental mode only new bookmarks, bookmarks last scraped more than
+    `stale_after_hours` ago and failed bookmarks whose backoff has expired are returned.
+    """
     cursor = conn.cursor()
 
+    # Fetch URLs
+    if incremental:
+        cursor.execute('''
+            SELECT url FROM bookmarks
+            WHERE (next_attempt_at IS NULL OR next_attempt_at <= datetime('now'))
+              AND (last_scraped_at IS NULL
+                   OR last_scraped_at <= datetime('now', ?)
+                   OR failure_count > 0)
+        ''', (f"-{stale_after_hours} hours",))
+    else:
+        cursor.execute("SELECT url FROM bookmarks")  
+    return [row[0] for row in cursor.fetchall()]
+
+def bookmarks_table_exists(conn):
+    cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='bookmarks'")
+    return cursor.fetchone() is not None
+
+def content_hash(description):
+    """Stable hash of a scraped description, used to tell whether a posting changed."""
+    return hashlib.sha256(description.encode("utf-8")).hexdigest()
+
+def start_or_resume_run(conn):
+    """
+    Return (run_id, completed_urls). An unfinished previous run is resumed so the
+    URLs it already saved are skipped (its failures are tried again); otherwise a
+    new run is started.
+    """
+    with conn:
+        row = conn.execute("SELECT id FROM scrape_runs WHERE finished_at IS NULL ORDER BY id DESC LIMIT 1").fetchone()
+        if row:
+            run_id = row[0]
+            cursor = conn.execute("SELECT url FROM scrape_checkpoints WHERE run_id = ?", (run_id,))
+            return run_id, {url for (url,) in cursor.fetchall()}
+
+        cursor = conn.execute("INSERT INTO scrape_runs DEFAULT VALUES")
+        return cursor.lastrowid, set()
+
+def finish_run(conn, run_id):
+    """
+    Delete a completed run and its checkpoints, along with runs marked finished by
+    earlier versions, so the next run starts from scratch.
+    """
+    with conn:
+        conn.execute('''
+            DELETE FROM scrape_checkpoints
+            WHERE run_id IN (SELECT id FROM scrape_runs WHERE id = ? OR finished_at IS NOT NULL)
+        ''', (run_id,))
+        conn.execute("DELETE FROM scrape_runs WHERE id = ? OR finished_at IS NOT NULL", (run_id,))
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape bookmarked jobs and store their skills")
+    parser.add_argument("--refresh", action="store_true", help="Ignore cached pages and scrape every URL again")
+    parser.add_argument("--max-age", type=float, default=DEFAULT_TTL,
+                        help="Reuse cached pages younger than this many seconds")
+    parser.add_argument("--cache-path", default=DEFAULT_CACHE_PATH, help="SQLite file for the page cache")
+    parser.add_argument("--cache-max-mb", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024,
+                        help="Evict the oldest cached pages beyond this size")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only scrape new, stale or previously failed bookmarks")
+    parser.add_argument("--stale-after", type=float, default=DEFAULT_STALE_AFTER_HOURS,
+                        help="Hours after which a scraped bookmark is due again in incremental mode")
+    parser.add_argument("--chunk-size", type=int, default=1,
+                        help="Results whose keywords are extracted and saved together; "
+                             "a crash loses up to this many finished URLs")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = parse_args()
+    conn = connect()
+
     # Check if the table exists before querying
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='bookmarks'")
-    if not cursor.fetchone():
+    if not bookmarks_table_exists(conn):
         print("ERROR: Table 'bookmarks' does not exist.")
         conn.close()
         sys.exit(1)
 
-    # Fetch URLs
-    cursor.execute("SELECT url FROM bookmarks")  
-    job_urls = [row[0] for row in cursor.fetchall()]  
+    ensure_schema(conn)  # Make sure the skills, scrape state and checkpoint schema exists
 
-    conn.close()
-    return job_urls
+    job_urls = fetch_job_urls(conn, incremental=args.incremental, stale_after_hours=args.stale_after)
 
-def ensure_skills_column():
-    """Ensure the 'skills' column exists in the 'bookmarks' table."""
-    conn = sqlite3.connect("bookmarks.db")
-    cursor = conn.cursor()
+    if not job_urls:
+        conn.close()
+        if args.incremental:
+            print("No new, stale or retryable bookmarks to scrape.")
+            sys.exit(0)
+        print("No job URLs found in the database.")
+        sys.exit(1)
 
+    # Fail now rather than after scraping if the spaCy model or NLTK data is missing
     try:
-        cursor.execute("ALTER TABLE bookmarks ADD COLUMN skills TEXT")
-        conn.commit()
-    except sqlite3.OperationalError:
-        pass  # Column already exists, no need to alter
-
-    conn.close()
-
-def save_extracted_skills(job_url, skills):
-    """Store extracted skills in the database."""
-    conn = sqlite3.connect("bookmarks.db")
-    cursor = conn.cursor()
-
-    # Convert skill set to a comma-separated string
-    skills_string = ",".join(skills)
-
-    # Update the database with extracted skills
-    cursor.execute("UPDATE bookmarks SET skills = ? WHERE url = ?", (skills_string, job_url))
-
-    conn.commit()
-    conn.close()
+        load_nlp_resources()
+    except MissingNLPDataError as e:
+        print(f"ERROR: {e}")
+        conn.close()
+        sys.exit(1)
 
-if __name__ == "__main__":
-    ensure_skills_column()  # Make sure the 'skills' column exists
+    # Skip URLs an interrupted earlier run already saved
+    run_id, completed_urls = start_or_resume_run(conn)
+    if completed_urls:
+        print(f"Resuming run {run_id}: {len(completed_urls)} URLs already done")
+    job_urls = [url for url in job_urls if url not in completed_urls]
 
-    job_urls = fetch_job_urls()
+    cache = PageCache(args.cache_path, ttl=args.max_age, max_bytes=int(args.cache_max_mb * 1024 * 1024))
 
-    if not job_urls:
-        print("No job URLs found in the database.")
-        sys.exit(1)
+    # Results arrive a chunk at a time; each chunk is written in a single transaction
+    writer = BookmarkWriter(conn, run_id, batch_size=args.chunk_size)
 
-    # Fast parallel extraction
+    # Fast parallel extraction, saving each chunk as soon as it is ready
     start_time = time.time()
-    results = extract_job_descriptions_parallel(job_urls, max_workers=4)
-    end_time = time.time()
-
-    # Final summary
-    print(f"\nExecution time: {end_time - start_time:.2f} seconds")
-    print("\nSummary:")
-
-    for url, result in results.items():
+    scraped = failed = 0
+    for url, result in iter_job_descriptions(
+        job_urls, max_workers=4, cache=cache, max_age=0 if args.refresh else None, chunk_size=args.chunk_size
+    ):
         if result["description"]:
             print(f"\nJob Title: {result['title']}")
             print(f"URL: {url}")
@@ -77,8 +141,26 @@ if __name__ == "__main__":
             # Extracted skills from job description
             extracted_skills = set(result["description_keywords"]) | set(result["requirements_keywords"])
             
-            # Save skills to the database
-            save_extracted_skills(url, extracted_skills)
+            # Queue skills for the database
+            writer.add_skills(url, extracted_skills, content_hash(result["description"]))
+            scraped += 1
         else:
             print(f"\nFailed - {url}")
             print(f"Title (if found): {result['title']}")
+            writer.add_failure(url)
+            failed += 1
+    writer.close()
+    end_time = time.time()
+
+    finish_run(conn, run_id)
+    conn.close()
+
+    evicted = cache.evict()
+    if evicted:
+        print(f"Evicted {evicted} old pages from the cache")
+    cache.close()
+
+    # Final summary
+    print(f"\nExecution time: {end_time - start_time:.2f} seconds")
+    print(f"Summary: {scraped} saved ({writer.unchanged} unchanged), {failed} failed, "
+          f"{len(completed_urls)} skipped from the previous run")
@@ -0,0 +1,40 @@
+from functools import lru_cache
+
+SPACY_MODEL = "en_core_web_sm"
+
+class MissingNLPDataError(RuntimeError):
+    """Raised when the spaCy model or NLTK corpus is not installed. Nothing is downloaded at runtime."""
+
+
+@lru_cache(maxsize=None)
+def get_nlp():
+    """The spaCy pipeline, loaded on first use and shared by the whole process."""
+    import spacy # type: ignore
+
+    try:
+        return spacy.load(SPACY_MODEL)
+    except OSError as e:
+        raise MissingNLPDataError(
+            f"spaCy model '{SPACY_MODEL}' is not installed. Install it once with: "
+            f"python -m spacy download {SPACY_MODEL}"
+        ) from e
+
+@lru_cache(maxsize=None)
+def get_stopwords(language="english"):
+    """NLTK's stopword list, read from local NLTK data on first use."""
+    import nltk # type: ignore
+
+    try:
+        nltk.data.find("corpora/stopwords")
+    except LookupError as e:
+        raise MissingNLPDataError(
+            "NLTK stopwords corpus is not installed. Install it once with: "
+            "python -m nltk.downloader stopwords"
+        ) from e
+    from nltk.corpus import stopwords # type: ignore
+    return frozenset(stopwords.words(language))
+
+def load_nlp_resources():
+    """Load everything keyword extraction needs now, so missing data fails before any scraping."""
+    get_stopwords()
+    get_nlp()
@@ -0,0 +1,138 @@
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+DEFAULT_CACHE_PATH = "page_cache.db"
+DEFAULT_TTL = 7 * 24 * 60 * 60  # One week
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024  # 50MB
+
+# Query parameters that only track how the link was reached, not which posting it is
+TRACKING_PARAMS = {"refid", "trackingid", "alternatechannel", "ref", "src", "source", "gclid", "fbclid"}
+
+def normalize_url(url):
+    """
+    Normalize a job URL for use as a cache key: lowercase scheme and host,
+    drop the fragment, tracking parameters and trailing slash, and sort the query.
+    """
+    parts = urlparse(url.strip())
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunparse((parts.scheme.lower(), parts.netloc.lower(), path, parts.params, urlencode(query), ""))
+
+
+class PageCache:
+    """
+    On-disk SQLite cache of scraped pages keyed by normalized URL.
+
+    Stores the raw title and description with their fetch time. Entries older
+    than `ttl` seconds are treated as missing; `evict()` drops the oldest
+    entries once the cached text exceeds `max_bytes`.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                url_key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                title TEXT,
+                description TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_pages_fetched_at ON pages (fetched_at)")
+        # job_selectors.SelectorStats counts, so the learned selector order carries across runs
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS selector_stats (
+                domain TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                selector_type TEXT NOT NULL,
+                selector TEXT NOT NULL,
+                attempts INTEGER NOT NULL,
+                hits INTEGER NOT NULL,
+                PRIMARY KEY (domain, kind, selector_type, selector)
+            )
+        ''')
+        self._conn.commit()
+
+    def get(self, url, max_age=None):
+        """
+        Return the cached {"title", "description", "fetched_at"} for a URL,
+        or None if it is missing or older than max_age (defaults to the TTL).
+        max_age=0 always misses, which forces a refresh.
+        """
+        max_age = self.ttl if max_age is None else max_age
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT title, description, fetched_at FROM pages WHERE url_key = ?",
+                (normalize_url(url),)
+            ).fetchone()
+        if not row or time.time() - row[2] >= max_age:
+            return None
+        return {"title": row[0], "description": row[1], "fetched_at": row[2]}
+
+    def put(self, url, title, description):
+        """Store a successfully scraped page, replacing any older copy."""
+        if not description:
+            return
+        size = len(description.encode("utf-8")) + len((title or "").encode("utf-8"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO pages (url_key, url, title, description, fetched_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (normalize_url(url), url, title, description, time.time(), size)
+            )
+            self._conn.commit()
+
+    def evict(self, max_bytes=None):
+        """Delete the oldest entries until the cache holds at most max_bytes. Returns rows removed."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        with self._lock:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM pages").fetchone()[0]
+            if total <= max_bytes:
+                return 0
+
+            stale_keys = []
+            for url_key, size in self._conn.execute("SELECT url_key, size FROM pages ORDER BY fetched_at"):
+                if total <= max_bytes:
+                    break
+                stale_keys.append((url_key,))
+                total -= size
+
+            self._conn.executemany("DELETE FROM pages WHERE url_key = ?", stale_keys)
+            self._conn.commit()
+        return len(stale_keys)
+
+    def load_selector_stats(self, stats):
+        """Replace a SelectorStats' counts with the ones stored here."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT domain, kind, selector_type, selector, attempts, hits FROM selector_stats"
+            ).fetchall()
+        stats.restore(rows)
+
+    def save_selector_stats(self, stats):
+        """Add the counts a SelectorStats recorded since it was loaded or last saved."""
+        rows = stats.take_unsaved()
+        with self._lock:
+            self._conn.executemany('''
+                INSERT INTO selector_stats (domain, kind, selector_type, selector, attempts, hits)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (domain, kind, selector_type, selector)
+                DO UPDATE SET attempts = attempts + excluded.attempts, hits = hits + excluded.hits
+            ''', rows)
+            self._conn.commit()
+        return len(rows)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,51 @@
+import io
+import pdfplumber
+import PyPDF2  # For PDF parsing
+
+# Resumes longer than this are almost certainly not resumes; stop reading there
+MAX_PDF_PAGES = 50
+MAX_TEXT_BYTES = 2 * 1024 * 1024
+
+def _open_source(source):
+    """pdfplumber and PyPDF2 both accept a path or a binary file object."""
+    return io.BytesIO(source) if isinstance(source, (bytes, bytearray)) else source
+
+def _iter_page_texts(source, backend, max_pages):
+    """Text of each of the first `max_pages` pages, opening the PDF once and calling extract_text once per page."""
+    if backend == "pdfplumber":
+        with pdfplumber.open(_open_source(source)) as pdf:
+            for page in pdf.pages[:max_pages]:
+                yield page.extract_text() or ""
+                page.close()  # Release the parsed page before the next one
+    else:
+        reader = PyPDF2.PdfReader(_open_source(source))
+        for page in reader.pages[:max_pages]:
+            yield page.extract_text() or ""
+
+def extract_pdf_text(source, backend="pdfplumber", separator="\n", max_pages=MAX_PDF_PAGES,
+                     max_bytes=MAX_TEXT_BYTES):
+    """
+    Extract the text of a PDF given as a path or as bytes.
+
+    Pages are read in order, at most `max_pages` of them, and reading stops as soon
+    as `max_bytes` of UTF-8 text have been collected, where the text is cut.
+    Non-empty pages are joined once with `separator`. `backend` is "pdfplumber"
+    or "pypdf2". Resumes are parsed one per worker by resume_jobs; a single PDF is
+    not split, since every worker would have to parse the whole file again.
+    """
+    pages = []
+    size = 0
+    separator_size = len(separator.encode("utf-8"))
+    for page in _iter_page_texts(source, backend, max_pages):
+        if not page:
+            continue
+        pages.append(page)
+        size += len(page.encode("utf-8")) + (separator_size if len(pages) > 1 else 0)
+        if size >= max_bytes:
+            break
+
+    text = separator.join(pages)
+    encoded = text.encode("utf-8")
+    if len(encoded) > max_bytes:
+        text = encoded[:max_bytes].decode("utf-8", errors="ignore")
+    return text
@@ -0,0 +1,113 @@
+import threading
+import time
+
+DEFAULT_BATCH_SIZE = 20  # Titles handed to refresh() per call
+DEFAULT_RETRY_AFTER = 5 * 60  # Seconds before a title whose refresh failed is queued again
+
+class ResourceRefresher:
+    """
+    Refreshes learning resources in a background thread, so readers can answer
+    from whatever is stored and queue missing or expired titles here.
+
+    enqueue() returns immediately; titles already queued or being refreshed are
+    not queued twice. The worker passes up to `batch_size` titles at a time to
+    refresh(titles), which returns the titles it could not refresh (their stored
+    resources must be left as they were); those are not queued again for
+    `retry_after` seconds. `version` is bumped after each batch. status() reports
+    the queue for polling; wait() blocks until the version moves past a given one
+    or the queue is empty (long polling).
+    """
+
+    def __init__(self, refresh, batch_size=DEFAULT_BATCH_SIZE, retry_after=DEFAULT_RETRY_AFTER):
+        self.refresh = refresh
+        self.batch_size = batch_size
+        self.retry_after = retry_after
+        self.version = 0
+        self._queued = {}   # title -> None, in arrival order
+        self._running = []
+        self._retry_at = {}  # failed title -> time.monotonic() when it may be queued again
+        self._last_refreshed_at = None
+        self._last_error = None
+        self._refreshed = 0
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def enqueue(self, titles):
+        """Queue titles for a refresh, except recently failed ones. Returns the number newly queued."""
+        with self._condition:
+            now = time.monotonic()
+            added = 0
+            for title in titles:
+                if title in self._retry_at and now < self._retry_at[title]:
+                    continue
+                if title not in self._queued and title not in self._running:
+                    self._queued[title] = None
+                    added += 1
+            if added:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name="resource-refresher", daemon=True)
+                    self._thread.start()
+                self._condition.notify_all()
+        return added
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._queued)
+                self._running = list(self._queued)[:self.batch_size]
+                for title in self._running:
+                    del self._queued[title]
+                batch = list(self._running)
+
+            error = None
+            try:
+                failed = set(self.refresh(batch) or ())
+                if failed:
+                    error = f"{len(failed)} of {len(batch)} titles could not be refreshed"
+            except Exception as e:
+                failed = set(batch)
+                error = f"{type(e).__name__}: {e}"
+                print(f"[ERROR] Refreshing resources for {len(batch)} titles: {error}")
+
+            with self._condition:
+                # Failed titles stay missing or stale; a later read queues them again after retry_after
+                retry_at = time.monotonic() + self.retry_after
+                for title in batch:
+                    if title in failed:
+                        self._retry_at[title] = retry_at
+                    else:
+                        self._retry_at.pop(title, None)
+                self._running = []
+                self.version += 1
+                self._last_refreshed_at = time.time()
+                self._last_error = error
+                self._refreshed += len(batch) - len(failed)
+                self._condition.notify_all()
+
+    def _status(self):
+        return {
+            "version": self.version,
+            "idle": not self._queued and not self._running,
+            "queued": list(self._queued),
+            "running": list(self._running),
+            "refreshed": self._refreshed,
+            "retry_pending": len(self._retry_at),
+            "last_refreshed_at": self._last_refreshed_at,
+            "last_error": self._last_error,
+        }
+
+    def status(self):
+        """Snapshot of the queue for polling."""
+        with self._condition:
+            return self._status()
+
+    def wait(self, since, timeout):
+        """
+        Block up to `timeout` seconds until a batch finishes after version `since`
+        or nothing is left to refresh, then return status().
+        """
+        with self._condition:
+            self._condition.wait_for(
+                lambda: self.version > since or (not self._queued and not self._running), timeout
+            )
+            return self._status()
@@ -0,0 +1,108 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+# Next to this module, whatever the working directory of the process using it
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "resume_cache.db")
+DEFAULT_MAX_ENTRIES = 500
+
+def sha256_bytes(data):
+    """SHA-256 hex digest of a resume's bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """SHA-256 hex digest of a resume file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ResumeCache:
+    """
+    Persistent LRU cache of parsed resumes keyed by the SHA-256 of the file bytes.
+
+    Each entry holds the extracted text and, once computed, the extracted skills
+    (any JSON-serializable value). `namespace` separates extractors whose output
+    differs for the same file, e.g. the pdfplumber path in skill_gap.py and the
+    PyPDF2/docx path in app_three.py. Only the `max_entries` most recently used
+    entries are kept.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS resumes (
+                sha256 TEXT NOT NULL,
+                namespace TEXT NOT NULL,
+                text TEXT NOT NULL,
+                skills TEXT,
+                last_used REAL NOT NULL,
+                PRIMARY KEY (sha256, namespace)
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_resumes_last_used ON resumes (last_used)")
+        self._conn.commit()
+
+    def get(self, digest, namespace):
+        """Return {"text", "skills"} for a cached resume (skills may be None), or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, skills FROM resumes WHERE sha256 = ? AND namespace = ?",
+                (digest, namespace)
+            ).fetchone()
+            if not row:
+                return None
+            self._conn.execute(
+                "UPDATE resumes SET last_used = ? WHERE sha256 = ? AND namespace = ?",
+                (time.time(), digest, namespace)
+            )
+            self._conn.commit()
+        return {"text": row[0], "skills": json.loads(row[1]) if row[1] is not None else None}
+
+    def put_text(self, digest, namespace, text):
+        """
+        Store the extracted text of a resume, evicting the least recently used entries.
+        Empty text is a failed parse and is not stored. Returns whether it was stored.
+        """
+        if not text or not text.strip():
+            return False
+        with self._lock:
+            self._conn.execute('''
+                INSERT INTO resumes (sha256, namespace, text, skills, last_used) VALUES (?, ?, ?, NULL, ?)
+                ON CONFLICT (sha256, namespace) DO UPDATE SET text = excluded.text, skills = NULL,
+                                                              last_used = excluded.last_used
+            ''', (digest, namespace, text, time.time()))
+            self._conn.execute('''
+                DELETE FROM resumes WHERE rowid IN (
+                    SELECT rowid FROM resumes ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+            ''', (self.max_entries,))
+            self._conn.commit()
+        return True
+
+    def put_skills(self, digest, namespace, skills):
+        """Attach extracted skills to an already cached resume."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE resumes SET skills = ?, last_used = ? WHERE sha256 = ? AND namespace = ?",
+                (json.dumps(skills), time.time(), digest, namespace)
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+@lru_cache(maxsize=None)
+def get_resume_cache():
+    """The resume cache shared by skill_gap.py and app_three.py, opened on first use in each process."""
+    return ResumeCache()
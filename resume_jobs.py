@@ -0,0 +1,128 @@
+import concurrent.futures
+import multiprocessing
+from concurrent.futures.process import BrokenProcessPool
+import threading
+import time
+import uuid
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_PENDING = 16
+DEFAULT_RESULT_TTL = 60 * 60  # Seconds a finished job stays available for polling
+
+class QueueFullError(Exception):
+    """Raised when max_pending analyses are already queued or running."""
+
+
+class ResumeJobQueue:
+    """
+    Runs resume analyses in a bounded process pool and tracks them by job ID.
+
+    submit() returns immediately; status() reports "queued", "running", "done"
+    or "failed" with the result or error. Submissions with the same key (the
+    file hash) while a job for it is pending or its result is still kept
+    return the existing job instead of parsing the file again. At most
+    `max_pending` jobs may be unfinished at once. Job dicts are only touched
+    under the queue's lock, including from the executor's callback thread.
+    """
+
+    def __init__(self, analyze, max_workers=DEFAULT_MAX_WORKERS, max_pending=DEFAULT_MAX_PENDING,
+                 result_ttl=DEFAULT_RESULT_TTL):
+        self.analyze = analyze
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self._executor = None
+        self._jobs = {}    # job_id -> job, in submission order
+        self._by_key = {}  # key -> job_id
+        self._lock = threading.Lock()
+
+    def _get_executor(self):
+        # Spawned workers do not inherit the parent's SQLite connections; started on first use
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+
+    def _prune(self):
+        """Forget finished jobs older than result_ttl."""
+        cutoff = time.time() - self.result_ttl
+        for job_id, job in list(self._jobs.items()):
+            if job["finished_at"] is not None and job["finished_at"] < cutoff:
+                del self._jobs[job_id]
+                if self._by_key.get(job["key"]) == job_id:
+                    del self._by_key[job["key"]]
+
+    def pending_count(self):
+        return sum(1 for job in self._jobs.values() if not job["future"].done())
+
+    def submit(self, key, *args):
+        """
+        Queue analyze(*args) and return (job_id, deduplicated). A pending or kept
+        job with the same key is returned instead, unless it failed.
+        Raises QueueFullError when max_pending jobs are unfinished.
+        """
+        with self._lock:
+            self._prune()
+            job_id = self._by_key.get(key)
+            if job_id is not None:
+                future = self._jobs[job_id]["future"]
+                if not (future.done() and future.exception() is not None):
+                    return job_id, True
+
+            if self.pending_count() >= self.max_pending:
+                raise QueueFullError(f"{self.max_pending} analyses are already pending")
+
+            job_id = uuid.uuid4().hex
+            job = {"key": key, "submitted_at": time.time(), "finished_at": None}
+            try:
+                job["future"] = self._get_executor().submit(self.analyze, *args)
+            except BrokenProcessPool:
+                # A worker died (e.g. killed for memory); its jobs report failed, new ones get a new pool
+                print("Resume analysis pool broke; starting a new one")
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+                job["future"] = self._get_executor().submit(self.analyze, *args)
+            self._jobs[job_id] = job
+            self._by_key[key] = job_id
+        # Outside the lock: an already finished future runs the callback right here
+        job["future"].add_done_callback(lambda _: self._finished(job))
+        return job_id, False
+
+    def _finished(self, job):
+        with self._lock:
+            job["finished_at"] = time.time()
+
+    def status(self, job_id):
+        """Status dict of a job, or None if it is unknown or expired."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            future = job["future"]
+            status = {"job_id": job_id, "submitted_at": job["submitted_at"]}
+
+            if future.done():
+                error = future.exception()
+                status["finished_at"] = job["finished_at"]
+                if error is not None:
+                    status.update(status="failed", error=str(error))
+                else:
+                    status.update(status="done", result=future.result())
+            elif future.running():
+                # Handed to a worker process
+                status.update(status="running")
+            else:
+                ahead = 0
+                for other_id, other in self._jobs.items():
+                    if other_id == job_id:
+                        break
+                    if not other["future"].running() and not other["future"].done():
+                        ahead += 1
+                status.update(status="queued", queue_position=ahead + 1)
+        return status
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
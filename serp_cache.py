@@ -0,0 +1,163 @@
+import concurrent.futures
+import json
+import sqlite3
+import threading
+import time
+from serpapi import GoogleSearch # type: ignore
+
+DEFAULT_CACHE_PATH = "serp_cache.db"
+DEFAULT_TTL = 24 * 60 * 60  # One day
+DEFAULT_EVICT_INTERVAL = 60 * 60  # Expired responses are dropped at most this often, on insert
+
+# Parameters that do not change the results and must not end up in the cache
+EXCLUDED_PARAMS = {"api_key", "serp_api_key", "source"}
+
+def query_key(params):
+    """Cache key for a search: its parameters without credentials, as canonical JSON."""
+    return json.dumps({key: params[key] for key in sorted(params) if key not in EXCLUDED_PARAMS},
+                      separators=(",", ":"))
+
+def serpapi_backend(backend_url=None):
+    """
+    Backend that runs a live GoogleSearch. `backend_url` points the client at another
+    SerpAPI-compatible server instead of serpapi.com, e.g. fake_serpapi.py.
+    """
+    def search(params):
+        client = GoogleSearch(dict(params))
+        if backend_url:
+            client.BACKEND = backend_url.rstrip("/")
+        return client.get_dict()
+    return search
+
+
+class RateLimiter:
+    """Spaces calls at least 1/rate seconds apart across all threads (a global requests-per-second cap)."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until this caller's slot comes up."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class SerpCache:
+    """
+    SQLite cache of SerpAPI responses keyed by the query parameters.
+
+    Responses younger than `ttl` seconds are served from the cache. Concurrent
+    identical searches that miss share one backend call, and backend calls wait
+    for `rate_limiter` if one is given; cache hits are never throttled. Responses
+    carrying an "error" (bad key, quota) are returned but never cached.
+    Expired responses are evicted every `evict_interval` seconds as new ones
+    are stored. `stats()` reports hits, misses (backend calls), coalesced waits and errors.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL, backend=None, rate_limiter=None,
+                 evict_interval=DEFAULT_EVICT_INTERVAL):
+        self.path = path
+        self.ttl = ttl
+        self.evict_interval = evict_interval
+        self._evicted_at = time.monotonic()
+        self.backend = backend or serpapi_backend()
+        self.rate_limiter = rate_limiter
+        self._lock = threading.Lock()
+        self._inflight = {}  # query key -> Future of the backend call
+        self._counters = {"hits": 0, "misses": 0, "coalesced": 0, "errors": 0}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS serp_responses (
+                query_key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        ''')
+        self._conn.commit()
+
+    def _get(self, key, max_age):
+        row = self._conn.execute(
+            "SELECT response, fetched_at FROM serp_responses WHERE query_key = ?", (key,)
+        ).fetchone()
+        if not row or time.time() - row[1] >= max_age:
+            return None
+        return json.loads(row[0])
+
+    def search(self, params, max_age=None):
+        """
+        Return the SerpAPI response dict for `params`, from the cache if it is younger
+        than max_age (defaults to the TTL). max_age=0 always calls the backend.
+        """
+        key = query_key(params)
+        max_age = self.ttl if max_age is None else max_age
+
+        with self._lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                self._counters["coalesced"] += 1
+                leader = False
+            else:
+                cached = self._get(key, max_age)
+                if cached is not None:
+                    self._counters["hits"] += 1
+                    return cached
+                self._counters["misses"] += 1
+                future = self._inflight[key] = concurrent.futures.Future()
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
+            response = self.backend(params)
+        except Exception as e:
+            with self._lock:
+                self._counters["errors"] += 1
+                del self._inflight[key]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            if "error" in response:
+                self._counters["errors"] += 1
+            else:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO serp_responses (query_key, response, fetched_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(response), time.time())
+                )
+                self._conn.commit()
+            del self._inflight[key]
+            evict_due = time.monotonic() - self._evicted_at >= self.evict_interval
+        future.set_result(response)
+        if evict_due:
+            self.evict()
+        return response
+
+    def stats(self):
+        """Counters since start-up plus the number of cached responses."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM serp_responses").fetchone()[0]
+            stats = dict(self._counters, entries=entries)
+        lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+        stats["hit_rate"] = round((stats["hits"] + stats["coalesced"]) / lookups, 3) if lookups else 0.0
+        return stats
+
+    def evict(self):
+        """Drop responses older than the TTL. Returns the number removed."""
+        with self._lock:
+            cursor = self._conn.execute("DELETE FROM serp_responses WHERE fetched_at <= ?", (time.time() - self.ttl,))
+            self._conn.commit()
+            self._evicted_at = time.monotonic()
+        return cursor.rowcount
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
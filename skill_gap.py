@@ -1,33 +1,44 @@
-import sqlite3
-import pdfplumber
 import re
 import os
+from bookmarks_store import connect, ensure_schema, fetch_skills_per_url, fetch_urls_requiring
+from skill_matrix import score_cohort
+from resume_cache import get_resume_cache, file_sha256
+from pdf_text import extract_pdf_text
 
 def fetch_extracted_job_skills():
-    """Fetch job skills per URL from 'bookmarks.db' (Forces database refresh)."""
-    conn = sqlite3.connect("bookmarks.db")
-    conn.row_factory = sqlite3.Row  # Ensures row data is fetched fresh
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT url, skills FROM bookmarks")
-    
-    job_skills_per_url = {}
-    
-    for row in cursor.fetchall():
-        url, skills = row
-        if skills:  
-            skills_list = skills.split(",")  
-            job_skills_per_url[url] = set(skill.strip().lower() for skill in skills_list)
-
+    """Fetch job skills per URL from the normalized skills tables in 'bookmarks.db'."""
+    conn = connect()
+    ensure_schema(conn)  # Migrates the old comma-joined column on first use
+    job_skills_per_url = fetch_skills_per_url(conn)
     conn.close()
     return job_skills_per_url  
 
+def fetch_jobs_requiring(skill):
+    """URLs of bookmarked jobs that need `skill`, without scanning every bookmark."""
+    conn = connect()
+    ensure_schema(conn)
+    urls = fetch_urls_requiring(conn, skill)
+    conn.close()
+    return urls
+
 def extract_skills_from_resume(resume_path):
-    """Extract all skills present in the resume."""
-    with pdfplumber.open(resume_path) as pdf:
-        text = "\n".join([page.extract_text() for page in pdf.pages if page.extract_text()])
+    """Extract all skills present in the resume, reusing cached results for identical files."""
+    resume_cache = get_resume_cache()
+    digest = file_sha256(resume_path)
+    cached = resume_cache.get(digest, "pdfplumber")
+    if cached and cached["skills"] is not None:
+        return set(cached["skills"])
+
+    if cached:
+        text = cached["text"]
+    else:
+        text = extract_pdf_text(resume_path, backend="pdfplumber", separator="\n")
+        if not resume_cache.put_text(digest, "pdfplumber", text):
+            return set()  # Failed or empty parse: nothing cached, so the next call parses again
     
-    return set(re.findall(r"\b\w+\b", text.lower()))  # Extract all words as possible skills
+    skills = set(re.findall(r"\b\w+\b", text.lower()))  # Extract all words as possible skills
+    resume_cache.put_skills(digest, "pdfplumber", sorted(skills))
+    return skills
 
 def skill_gap_analysis(resume_path):
     """Compare resume skills against each job URL."""
@@ -43,12 +54,53 @@ def skill_gap_analysis(resume_path):
 
     return missing_skills_per_url
 
+def cohort_skill_gap_analysis(resume_paths, top_k=5):
+    """
+    Score many resumes against every bookmarked job at once.
+
+    Returns the score_cohort() result keyed by resume path: missing-skill counts and
+    coverage percentages as resumes x jobs matrices, plus the top_k best jobs per resume.
+    """
+    job_skills_per_url = fetch_extracted_job_skills()
+    resume_skills = {path: extract_skills_from_resume(path) for path in resume_paths}
+    return score_cohort(resume_skills, job_skills_per_url, top_k=top_k)
+
 import sys
 import os
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python skill_gap.py <resume_path>")
+        print("       python skill_gap.py --jobs-needing <skill>")
+        print("       python skill_gap.py --cohort [--top-k N] <resume_path> [<resume_path> ...]")
+        exit()
+
+    if sys.argv[1] == "--cohort":
+        args = sys.argv[2:]
+        top_k = 5
+        if len(args) >= 2 and args[0] == "--top-k":
+            top_k = int(args[1])
+            args = args[2:]
+        resume_paths = [path for path in args if os.path.exists(path)]
+        for path in set(args) - set(resume_paths):
+            print("WARNING: File not found, skipping:", path)
+        if not resume_paths:
+            print("ERROR: No resumes to analyze!")
+            exit()
+
+        cohort = cohort_skill_gap_analysis(resume_paths, top_k=top_k)
+        print(f"\nScored {len(cohort['resumes'])} resumes against {len(cohort['urls'])} jobs")
+        for path in cohort["resumes"]:
+            print(f"\nResume: {path}")
+            for job in cohort["top_jobs"][path]:
+                print(f"  {job['coverage']:5.1f}% covered, {job['missing_count']} missing - {job['url']}")
+        exit()
+
+    if sys.argv[1] == "--jobs-needing" and len(sys.argv) > 2:
+        urls = fetch_jobs_requiring(sys.argv[2])
+        print(f"{len(urls)} bookmarked jobs need {sys.argv[2]}:")
+        for url in urls:
+            print(url)
         exit()
 
     resume_path = sys.argv[1]
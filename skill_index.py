@@ -0,0 +1,126 @@
+import sqlite3
+import threading
+from collections import Counter
+from urllib.parse import urlparse
+from bookmarks_store import DB_PATH, connect, ensure_schema, normalize_skill
+
+# Display names of the job boards bookmarks usually come from
+JOB_SOURCES = {
+    "linkedin.com": "LinkedIn",
+    "indeed.com": "Indeed",
+    "glassdoor.com": "Glassdoor",
+    "monster.com": "Monster",
+    "unstop.com": "Unstop",
+    "internshala.com": "Internshala",
+}
+
+def job_source(url):
+    """Job board name for a bookmark URL, falling back to its domain."""
+    domain = urlparse(url).netloc.lower()
+    for suffix, name in JOB_SOURCES.items():
+        if suffix in domain:
+            return name
+    return domain.removeprefix("www.") or "Other"
+
+
+class JobSkillIndex:
+    """
+    In-process index of bookmarked jobs and their extracted skills, with a
+    skill -> jobs inverted index for scoring resumes.
+
+    The index is rebuilt only when PRAGMA data_version shows that another
+    connection (the scraper, the bookmark services) committed to the database
+    since the last build, so repeated skill-gap requests cost no queries beyond
+    that one pragma. Reading never changes the schema: call ensure_schema() at
+    start-up, and a database without the skill tables yet reads as an empty index.
+    """
+
+    def __init__(self, db_path=DB_PATH):
+        self.db_path = db_path
+        self._conn = None
+        self._version = None
+        self._jobs = []       # {"url", "title", "source", "skills"}, one per bookmark with skills
+        self._postings = {}   # skill -> indices into _jobs
+        self._lock = threading.Lock()
+
+    def ensure_schema(self):
+        """Create or migrate the skill tables, if the bookmarks table exists yet. Run once at start-up."""
+        conn = connect(self.db_path)
+        try:
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'bookmarks'").fetchone():
+                ensure_schema(conn)
+        finally:
+            conn.close()
+
+    def _refresh(self):
+        if self._conn is None:
+            # data_version is per connection, so the same one is reused for every check
+            self._conn = connect(self.db_path, check_same_thread=False)
+
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._version:
+            return
+
+        jobs = {}
+        try:
+            rows = self._conn.execute('''
+                SELECT b.url, b.title, s.name
+                FROM bookmark_skills bs
+                JOIN bookmarks b ON b.id = bs.bookmark_id
+                JOIN skills s ON s.id = bs.skill_id
+                ORDER BY b.id
+            ''').fetchall()
+        except sqlite3.OperationalError:
+            rows = []  # No bookmarks or skill tables yet; a later commit creating them bumps data_version
+        for url, title, name in rows:
+            job = jobs.get(url)
+            if job is None:
+                job = jobs[url] = {"url": url, "title": title or url, "source": job_source(url), "skills": set()}
+            job["skills"].add(name)
+
+        postings = {}
+        for index, job in enumerate(jobs.values()):
+            for skill in job["skills"]:
+                postings.setdefault(skill, []).append(index)
+
+        self._jobs = list(jobs.values())
+        self._postings = postings
+        self._version = version
+
+    def score(self, resume_skills):
+        """
+        Match resume skills against every indexed job.
+
+        Returns a list of {"job", "matched", "missing", "match_percentage"} in
+        index order, where "matched"/"missing" are sorted normalized skill names.
+        """
+        with self._lock:
+            self._refresh()
+            jobs, postings = self._jobs, self._postings
+
+        wanted = {normalize_skill(skill) for skill in resume_skills if isinstance(skill, str)}
+        wanted.discard("")
+
+        # Only jobs sharing at least one skill are touched when counting matches
+        matched_counts = Counter()
+        for skill in wanted:
+            for index in postings.get(skill, ()):
+                matched_counts[index] += 1
+
+        scores = []
+        for index, job in enumerate(jobs):
+            matched = sorted(job["skills"] & wanted) if matched_counts[index] else []
+            scores.append({
+                "job": job,
+                "matched": matched,
+                "missing": sorted(job["skills"].difference(matched)),
+                "match_percentage": round(matched_counts[index] / len(job["skills"]) * 100, 1),
+            })
+        return scores
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._version = None
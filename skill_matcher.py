@@ -0,0 +1,74 @@
+import re
+
+_BOUNDARY = re.compile(r"\b")
+
+def _trie_pattern(node):
+    """Regex for a character trie, longest continuation first, so shared prefixes are tested once."""
+    branches = [re.escape(char) + _trie_pattern(child) for char, child in sorted(node.items()) if char]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+    if "" in node:
+        # A skill ends here: try the longer skills first, then settle for this one
+        return "(?:" + pattern + ")?"
+    return pattern
+
+
+class SkillMatcher:
+    """
+    Finds every skill of a vocabulary in one scan of the text.
+
+    The skills are compiled into a single trie-shaped regex inside a lookahead, so
+    overlapping matches ("java" in "java/javascript", "aws" in "aws certified") are
+    all reported. With `word_boundaries` a skill matches exactly like
+    re.search(r'\\b' + re.escape(skill) + r'\\b', text, re.IGNORECASE); without it,
+    like `skill in text`.
+    """
+
+    def __init__(self, skills, word_boundaries=True):
+        self.skills = list(dict.fromkeys(skill for skill in skills if skill))
+        self.word_boundaries = word_boundaries
+        self._flags = re.IGNORECASE if word_boundaries else 0
+
+        trie = {}
+        for skill in self.skills:
+            node = trie
+            for char in skill:
+                node = node.setdefault(char, {})
+            node[""] = {}
+
+        boundary = r"\b" if word_boundaries else ""
+        self._pattern = re.compile(rf"{boundary}(?=({_trie_pattern(trie)}){boundary})", self._flags)
+        self._by_text = {skill.lower() if word_boundaries else skill: skill for skill in self.skills}
+
+        # The regex reports the longest skill at each position; shorter skills that
+        # are prefixes of it may match there too and are checked directly
+        self._prefixes = {
+            skill: [other for other in self.skills
+                    if len(other) < len(skill) and self._key(skill).startswith(self._key(other))]
+            for skill in self.skills
+        }
+
+    def _key(self, text):
+        return text.lower() if self.word_boundaries else text
+
+    def _resolve(self, matched):
+        key = self._key(matched)
+        skill = self._by_text.get(key)
+        if skill is None:
+            # Case-insensitive equivalents that lower() does not map (e.g. "ſ" for "s"); remembered
+            skill = next(skill for skill in self.skills if re.fullmatch(re.escape(skill), matched, self._flags))
+            self._by_text[key] = skill
+        return skill
+
+    def find_all(self, text):
+        """Set of the skills that occur in text."""
+        found = set()
+        for match in self._pattern.finditer(text):
+            skill = self._resolve(match.group(1))
+            found.add(skill)
+            start = match.start(1)
+            for shorter in self._prefixes[skill]:
+                if not self.word_boundaries or _BOUNDARY.match(text, start + len(shorter)):
+                    found.add(shorter)
+        return found
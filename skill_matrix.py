@@ -0,0 +1,87 @@
+import numpy as np # type: ignore
+
+def build_vocabulary(job_skills_per_url):
+    """
+    Map every job skill to an integer column ID. Resume words outside this
+    vocabulary can never close a gap, so they are not given IDs.
+    """
+    vocabulary = {}
+    for skills in job_skills_per_url.values():
+        for skill in skills:
+            if skill not in vocabulary:
+                vocabulary[skill] = len(vocabulary)
+    return vocabulary
+
+def to_matrix(skill_sets, vocabulary):
+    """Boolean matrix with one row per skill set and one column per vocabulary skill."""
+    matrix = np.zeros((len(skill_sets), len(vocabulary)), dtype=bool)
+    for row, skills in enumerate(skill_sets):
+        columns = [vocabulary[skill] for skill in skills if skill in vocabulary]
+        matrix[row, columns] = True
+    return matrix
+
+def score_cohort(resume_skills, job_skills_per_url, top_k=5, batch_size=256):
+    """
+    Score many resumes against many jobs in batched matrix operations.
+
+    Args:
+        resume_skills: Dict mapping a resume name to its set of skills
+        job_skills_per_url: Dict mapping a job URL to its set of required skills
+        top_k: Number of best-matching jobs to report per resume
+        batch_size: Resumes scored per matrix product, bounding peak memory
+
+    Returns:
+        dict with "urls" and "resumes" (row/column labels), "missing_counts"
+        (resumes x jobs int32), "coverage" (resumes x jobs percentage of each
+        job's skills the resume has; jobs without skills count as 100%) and
+        "top_jobs" mapping each resume to its best jobs by coverage.
+    """
+    urls = list(job_skills_per_url)
+    resumes = list(resume_skills)
+    vocabulary = build_vocabulary(job_skills_per_url)
+
+    # float32 products are exact for counts below 2**24 and use BLAS
+    jobs = to_matrix([job_skills_per_url[url] for url in urls], vocabulary).astype(np.float32)
+    job_sizes = jobs.sum(axis=1)
+    safe_sizes = np.where(job_sizes > 0, job_sizes, 1)
+
+    missing_counts = np.empty((len(resumes), len(urls)), dtype=np.int32)
+    coverage = np.empty((len(resumes), len(urls)), dtype=np.float32)
+    top_jobs = {}
+    k = min(top_k, len(urls))
+
+    for start in range(0, len(resumes), batch_size):
+        names = resumes[start:start + batch_size]
+        batch = to_matrix([resume_skills[name] for name in names], vocabulary).astype(np.float32)
+
+        matched = batch @ jobs.T
+        batch_missing = (job_sizes - matched).astype(np.int32)
+        batch_coverage = np.where(job_sizes > 0, matched / safe_sizes * 100, 100.0)
+        missing_counts[start:start + len(names)] = batch_missing
+        coverage[start:start + len(names)] = batch_coverage
+
+        if k == 0:
+            top_jobs.update({name: [] for name in names})
+            continue
+
+        # Highest coverage first, fewer missing skills breaking ties
+        rank_key = batch_coverage.astype(np.float64) - batch_missing * 1e-6
+        candidates = np.argpartition(-rank_key, k - 1, axis=1)[:, :k]
+        for row, name in enumerate(names):
+            best = sorted(candidates[row], key=lambda job: -rank_key[row, job])
+            top_jobs[name] = [
+                {
+                    "url": urls[job],
+                    "coverage": round(float(batch_coverage[row, job]), 1),
+                    "missing_count": int(batch_missing[row, job]),
+                }
+                for job in best
+            ]
+
+    return {
+        "urls": urls,
+        "resumes": resumes,
+        "missing_counts": missing_counts,
+        "coverage": coverage,
+        "top_jobs": top_jobs,
+    }
@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from category_matcher import MultiPatternMatcher
+from skill_matcher import SkillMatcher
+
+TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "taxonomy.json")
+
+# Running services look at taxonomy.json's modification time at most this often
+RELOAD_CHECK_SECONDS = 2.0
+
+class Taxonomy:
+    """
+    The shared vocabularies from taxonomy.json and their compiled matchers:
+    resume skills with aliases (app_three), job categories and stopwords
+    (job_Des), and company names and job roles with aliases (email_parser).
+
+    Skill names and skill aliases are lowercase; aliases map to a canonical name
+    from the same vocabulary. Instances are never modified; a reload builds a new one.
+    """
+
+    def __init__(self, data, fingerprint):
+        self.version = data["version"]
+        self.fingerprint = fingerprint
+
+        skills = data["skills"]
+        self.technical_skills = skills["technical"]  # category -> skills
+        self.soft_skills = skills["soft"]
+        self.certifications = skills["certifications"]
+        self.job_categories = data["job_categories"]
+        self.custom_stopwords = frozenset(data["stopwords"]["custom"])
+        self.generic_tech_terms = frozenset(data["stopwords"]["generic_tech"])
+        self.companies = data["companies"]
+        self.job_roles = data["job_roles"]
+
+        skill_terms = [skill for skill_list in self.technical_skills.values() for skill in skill_list]
+        skill_terms += self.soft_skills
+        aliases = data.get("aliases", {})
+        self.skill_aliases = self._check_aliases(aliases.get("skills", {}), skill_terms, "skills")
+        role_aliases = self._check_aliases(aliases.get("job_roles", {}), self.job_roles, "job_roles")
+        # Lowercased role or alias -> role as listed
+        self._role_terms = {role.lower(): role for role in self.job_roles}
+        self._role_terms.update((alias.lower(), role) for alias, role in role_aliases.items())
+
+        # Technical and soft skills match on word boundaries; certifications, companies
+        # and roles keep their plain case-insensitive substring matches
+        self.skill_matcher = SkillMatcher(skill_terms + list(self.skill_aliases))
+        self.certification_matcher = SkillMatcher([cert.lower() for cert in self.certifications],
+                                                  word_boundaries=False)
+        self.category_matcher = MultiPatternMatcher(self.job_categories)
+        self.company_matcher = SkillMatcher([company.lower() for company in self.companies],
+                                            word_boundaries=False)
+        self.role_matcher = SkillMatcher(list(self._role_terms), word_boundaries=False)
+        self._job_related = {}
+
+    @staticmethod
+    def _check_aliases(aliases, vocabulary, section):
+        known = set(vocabulary)
+        unknown = sorted(canonical for canonical in aliases.values() if canonical not in known)
+        if unknown:
+            raise ValueError(f"aliases.{section} point to unknown entries: {', '.join(unknown)}")
+        return dict(aliases)
+
+    def find_skills(self, text):
+        """Canonical technical and soft skills in lowercased text, aliases included."""
+        return {self.skill_aliases.get(term, term) for term in self.skill_matcher.find_all(text)}
+
+    def find_certifications(self, text):
+        """Lowercased certifications contained in lowercased text."""
+        return self.certification_matcher.find_all(text)
+
+    def is_job_related(self, term):
+        """True if the lowercased term contains a job category, memoized per term."""
+        related = self._job_related.get(term)
+        if related is None:
+            related = self._job_related[term] = self.category_matcher.contains_any(term.lower())
+        return related
+
+    def is_job_related_lemma(self, lemma):
+        """is_job_related() that also matches the lemma's original case."""
+        return self.is_job_related(lemma) or self.category_matcher.contains_any(lemma)
+
+    def find_company(self, text):
+        """First known company, in taxonomy order, mentioned in text; None if there is none."""
+        found = self.company_matcher.find_all(text.lower())
+        return next((company for company in self.companies if company.lower() in found), None)
+
+    def find_roles(self, text):
+        """Job roles, as listed, mentioned in text; aliases included."""
+        return {self._role_terms[term] for term in self.role_matcher.find_all(text.lower())}
+
+
+def load_taxonomy(path=TAXONOMY_PATH):
+    """Load a taxonomy file and compile its matchers."""
+    with open(path, "rb") as file:
+        raw = file.read()
+    return Taxonomy(json.loads(raw), hashlib.sha256(raw).hexdigest())
+
+_current = None
+_current_stat = None
+_checked_at = 0.0
+_lock = threading.Lock()
+
+def _file_stat(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+def reload_taxonomy():
+    """
+    Load taxonomy.json now and make it current. If the file is invalid the error is
+    raised and the previous taxonomy stays in service.
+    """
+    global _current, _current_stat
+    with _lock:
+        stat = _file_stat(TAXONOMY_PATH)
+        taxonomy = load_taxonomy(TAXONOMY_PATH)
+        _current, _current_stat = taxonomy, stat
+    return taxonomy
+
+def get_taxonomy():
+    """
+    The current taxonomy, loaded on first use. taxonomy.json is checked for changes
+    every RELOAD_CHECK_SECONDS, so running services pick up edits without a restart.
+    """
+    global _current_stat, _checked_at
+    if _current is not None and time.monotonic() - _checked_at < RELOAD_CHECK_SECONDS:
+        return _current
+
+    if _current is None:
+        reload_taxonomy()  # Errors on first load are fatal: there is nothing to fall back to
+    else:
+        try:
+            stat = _file_stat(TAXONOMY_PATH)
+        except OSError:
+            stat = _current_stat
+        if stat != _current_stat:
+            try:
+                taxonomy = reload_taxonomy()
+                print(f"Reloaded skill taxonomy version {taxonomy.version}")
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                # Keep serving the previous taxonomy until the file is fixed
+                _current_stat = stat
+                print(f"Ignoring invalid taxonomy file: {e}")
+    _checked_at = time.monotonic()
+    return _current
@@ -0,0 +1,75 @@
+import json
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# The services are flat scripts in the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bookmarks_store import bookmark_row
+from fake_serpapi import start_fake_serpapi
+from fixture_server import start_fixture_server
+from resource_refresher import ResourceRefresher
+from serp_cache import SerpCache, serpapi_backend
+
+
+@pytest.fixture(scope="session")
+def fixture_site():
+    """Base URL of the local server for fixtures/pages."""
+    server, base_url = start_fixture_server()
+    yield base_url
+    server.shutdown()
+
+
+@pytest.fixture
+def fake_serpapi():
+    """(server, base_url) of a fresh fake SerpAPI, so request counts start at zero."""
+    server, base_url = start_fake_serpapi()
+    yield server, base_url
+    server.shutdown()
+
+
+@pytest.fixture
+def resources_app(tmp_path, monkeypatch, fake_serpapi):
+    """
+    app_four against a bookmarks.db in tmp_path and the fake SerpAPI, with its own
+    search cache and background refresher. Returns the app_four module; add
+    bookmarks with add_bookmarks(titles).
+    """
+    import app_four
+
+    server, base_url = fake_serpapi
+    monkeypatch.chdir(tmp_path)
+    conn = sqlite3.connect("bookmarks.db")
+    conn.execute("CREATE TABLE bookmarks (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL, "
+                 "url TEXT NOT NULL UNIQUE, normalized_title TEXT, domain TEXT)")
+    conn.commit()
+    conn.close()
+
+    cache = SerpCache(str(tmp_path / "serp_cache.db"), backend=serpapi_backend(base_url))
+    monkeypatch.setattr(app_four, "SERP_API_KEY", "test")
+    monkeypatch.setattr(app_four, "_serp_cache", cache)
+    monkeypatch.setattr(app_four, "resource_refresher", ResourceRefresher(app_four.refresh_title_resources))
+    app_four.ensure_resources_column()
+    yield app_four
+    cache.close()
+
+
+def add_bookmarks(titles):
+    """Insert bookmarks with these raw titles into ./bookmarks.db, as app_two does."""
+    conn = sqlite3.connect("bookmarks.db")
+    with conn:
+        conn.executemany("INSERT INTO bookmarks (title, url, normalized_title, domain) VALUES (?, ?, ?, ?)",
+                         [bookmark_row(title, f"https://jobs.example.com/{index}") for index, title in enumerate(titles)])
+    conn.close()
+
+
+def store_resources(title, resources, fetched_at):
+    """Put a title_resources row in ./bookmarks.db directly."""
+    conn = sqlite3.connect("bookmarks.db")
+    with conn:
+        conn.execute("INSERT OR REPLACE INTO title_resources (title, resources, fetched_at) VALUES (?, ?, ?)",
+                     (title, json.dumps(resources), fetched_at))
+    conn.close()
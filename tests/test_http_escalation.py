@@ -0,0 +1,75 @@
+import pytest
+
+import job_Des
+from driver_pool import DriverPool
+from http_fetch import FetchStats, fetch_page
+from job_selectors import MIN_DESCRIPTION_LENGTH, selector_stats
+
+RENDERED_DESCRIPTION = "We are looking for a frontend developer to build web and mobile interfaces. " * 3
+
+
+@pytest.fixture
+def browser(monkeypatch):
+    """A DriverPool of stand-in browsers; scrape_page returns the JS-rendered page and records its URLs."""
+    loaded = []
+
+    def scrape_page(driver, job_url, single_shot=True, deadline=5):
+        loaded.append(job_url)
+        return "Frontend Developer", RENDERED_DESCRIPTION
+
+    monkeypatch.setattr(job_Des, "scrape_page", scrape_page)
+    with DriverPool(object, size=1) as pool:
+        yield pool, loaded
+
+
+@pytest.fixture(autouse=True)
+def clean_selector_stats():
+    selector_stats.take_unsaved()
+    yield
+    selector_stats.take_unsaved()
+
+
+def scrape(url, pool):
+    stats = FetchStats()
+    result = job_Des.get_job_description(url, pool, stats=stats, with_keywords=False, raise_errors=True)
+    return result, stats.counts
+
+
+def test_static_page_is_served_over_http(fixture_site, browser):
+    pool, loaded = browser
+    result, counts = scrape(f"{fixture_site}/static_job.html", pool)
+
+    assert result["title"] == "Data Analyst Internship"
+    assert "Working knowledge of SQL" in result["description"]
+    assert counts == {"http": 1}
+    assert loaded == []
+
+
+@pytest.mark.parametrize("page", ["dynamic_job.html", "short_job.html"])
+def test_page_without_static_description_escalates_to_selenium(fixture_site, browser, page):
+    pool, loaded = browser
+    url = f"{fixture_site}/{page}"
+    title, description = fetch_page(url)
+    assert not description or len(description) <= MIN_DESCRIPTION_LENGTH
+
+    result, counts = scrape(url, pool)
+
+    assert result["description"] == RENDERED_DESCRIPTION
+    assert counts == {"selenium": 1}
+    assert loaded == [url]
+
+
+def test_escalated_page_records_no_http_selector_stats(fixture_site, browser):
+    pool, _ = browser
+    scrape(f"{fixture_site}/dynamic_job.html", pool)
+
+    # scrape_page is stubbed, so the browser attempt records nothing either
+    assert selector_stats.take_unsaved() == []
+
+
+def test_http_page_records_selector_stats_once(fixture_site, browser):
+    pool, _ = browser
+    scrape(f"{fixture_site}/static_job.html", pool)
+
+    rows = selector_stats.take_unsaved()
+    assert rows and {attempts for *_, attempts, _ in rows} == {1}
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from conftest import add_bookmarks, store_resources
+
+
+@pytest.fixture
+def failing_backend(resources_app, monkeypatch):
+    """Searches mentioning a role in `failing` fail: raised errors or SerpAPI error responses."""
+    cache = resources_app.get_serp_cache()
+    live = cache.backend
+    failing = {}
+
+    def backend(params):
+        for role, failure in failing.items():
+            if role in params["q"]:
+                if failure == "raise":
+                    raise ConnectionError("connection reset")
+                return {"error": "Your account has run out of searches."}
+        return live(params)
+
+    monkeypatch.setattr(cache, "backend", backend)
+    return failing
+
+
+def stored_titles(app):
+    conn = app.init_db()
+    titles = {row["title"] for row in conn.execute("SELECT title FROM title_resources")}
+    conn.close()
+    return titles
+
+
+def test_one_failing_title_does_not_drop_the_others(resources_app, failing_backend):
+    failing_backend["Software Engineer"] = "raise"
+    add_bookmarks(["Data Analyst | Indeed", "Software Engineer - Remote", "Product Manager at Acme"])
+
+    response = resources_app.app.test_client().get("/resources_for_all_bookmarks")
+
+    assert response.status_code == 200
+    resources = {row["job_title"]: row["resources"] for row in response.json}
+    assert resources["Data Analyst"]["General"] and resources["Product Manager"]["General"]
+    assert resources["Software Engineer"] == {}
+    assert stored_titles(resources_app) == {"Data Analyst", "Product Manager"}
+
+
+@pytest.mark.parametrize("failure", ["raise", "error response"])
+def test_failed_search_is_never_stored_as_fresh(resources_app, failing_backend, failure):
+    failing_backend["Data Analyst"] = failure
+    add_bookmarks(["Data Analyst | Indeed"])
+    client = resources_app.app.test_client()
+
+    client.get("/resources_for_all_bookmarks")
+    assert stored_titles(resources_app) == set()
+
+    response = client.get("/resources_from_db")
+    assert response.json[0]["status"] == "missing"
+
+
+def test_failed_refresh_keeps_the_stored_resources(resources_app, failing_backend):
+    stored = {"leetcode": [], "forage": [], "General": [{"title": "Stored course", "link": "https://example.com"}]}
+    failing_backend["Data Analyst"] = "error response"
+    add_bookmarks(["Data Analyst | Indeed"])
+    store_resources("Data Analyst", stored, 0)
+    client = resources_app.app.test_client()
+
+    response = client.get("/resources_from_db")
+    status = client.get(f"/resources_refresh_status?since={response.headers['X-Resources-Version']}&wait=10").json
+    assert status["last_error"] and status["retry_pending"] == 1
+
+    row = client.get("/resources_from_db").json[0]
+    assert row["status"] == "stale" and row["resources"] == stored
+
+    refreshed = client.get("/resources_for_all_bookmarks?refresh=1").json
+    assert refreshed == [{"job_title": "Data Analyst", "resources": stored}]
@@ -0,0 +1,62 @@
+import time
+
+from conftest import add_bookmarks, store_resources
+
+RESOURCES = {"leetcode": [], "forage": [], "General": [{"title": "Stored course", "link": "https://example.com"}]}
+
+
+def statuses(response):
+    return {row["title"]: row["status"] for row in response.json}
+
+
+def test_statuses_and_background_refresh(resources_app, fake_serpapi):
+    server, _ = fake_serpapi
+    add_bookmarks(["Data Analyst | Indeed", "Software Engineer - Remote", "Product Manager at Acme"])
+    store_resources("Data Analyst", RESOURCES, time.time())
+    store_resources("Software Engineer", RESOURCES, 0)  # Long expired
+    client = resources_app.app.test_client()
+
+    response = client.get("/resources_from_db")
+
+    assert response.status_code == 200
+    assert statuses(response) == {
+        "Data Analyst | Indeed": "fresh",
+        "Software Engineer - Remote": "stale",
+        "Product Manager at Acme": "missing",
+    }
+    stale = next(row for row in response.json if row["status"] == "stale")
+    assert stale["resources"] == RESOURCES  # Answered from what is stored, without waiting
+
+    version = int(response.headers["X-Resources-Version"])
+    status = client.get(f"/resources_refresh_status?since={version}&wait=10").json
+    assert status["version"] > version and status["last_error"] is None
+
+    assert set(statuses(client.get("/resources_from_db")).values()) == {"fresh"}
+    # Both searches of the stale and the missing title; the fresh one is never searched
+    assert server.request_count == 4
+
+
+def test_bookmarks_sharing_a_title_are_refreshed_once(resources_app, fake_serpapi):
+    server, _ = fake_serpapi
+    add_bookmarks(["Data Analyst | Indeed", "Data Analyst | LinkedIn", "Data Analyst - Bangalore"])
+    client = resources_app.app.test_client()
+
+    response = client.get("/resources_from_db")
+    assert set(statuses(response).values()) == {"missing"}
+
+    client.get(f"/resources_refresh_status?since={response.headers['X-Resources-Version']}&wait=10")
+    assert set(statuses(client.get("/resources_from_db")).values()) == {"fresh"}
+    assert server.request_count == 2
+
+
+def test_rows_without_normalized_title_use_the_cleaned_title(resources_app):
+    add_bookmarks(["Data Analyst | Indeed"])
+    store_resources("Data Analyst", RESOURCES, time.time())
+    conn = resources_app.init_db()
+    with conn:
+        conn.execute("UPDATE bookmarks SET normalized_title = NULL")
+    conn.close()
+
+    response = resources_app.app.test_client().get("/resources_from_db")
+
+    assert response.json == [{"title": "Data Analyst | Indeed", "resources": RESOURCES, "status": "fresh"}]
@@ -0,0 +1,69 @@
+import concurrent.futures
+
+import pytest
+
+from serp_cache import SerpCache, serpapi_backend
+
+PARAMS = {"engine": "google", "q": "Data Analyst courses", "api_key": "test", "num": 3}
+
+
+@pytest.fixture
+def cache(tmp_path, fake_serpapi):
+    server, base_url = fake_serpapi
+    cache = SerpCache(str(tmp_path / "serp_cache.db"), ttl=3600, backend=serpapi_backend(base_url))
+    yield cache, server
+    cache.close()
+
+
+def test_repeated_search_is_served_from_the_cache(cache):
+    cache, server = cache
+    first = cache.search(PARAMS)
+    second = cache.search(dict(PARAMS, api_key="other key"))  # Credentials are not part of the key
+
+    assert second == first
+    assert len(first["organic_results"]) == 3
+    assert server.request_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_max_age_zero_refreshes_the_cached_response(cache):
+    cache, server = cache
+    first = cache.search(PARAMS)
+    refreshed = cache.search(PARAMS, max_age=0)
+
+    assert server.request_count == 2
+    assert "(fetch 2)" in refreshed["organic_results"][0]["title"]
+    assert cache.search(PARAMS) == refreshed != first
+
+
+def test_cached_response_survives_a_new_cache_instance(cache):
+    cache, server = cache
+    cache.search(PARAMS)
+
+    reopened = SerpCache(cache.path, ttl=3600, backend=lambda params: pytest.fail("backend called"))
+    assert reopened.search(PARAMS)["organic_results"]
+    reopened.close()
+    assert server.request_count == 1
+
+
+def test_concurrent_identical_searches_share_one_request(tmp_path, fake_serpapi):
+    server, base_url = fake_serpapi
+    server.delay = 0.2
+    cache = SerpCache(str(tmp_path / "serp_cache.db"), backend=serpapi_backend(base_url))
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: cache.search(PARAMS), range(4)))
+
+    assert server.request_count == 1
+    assert all(result == results[0] for result in results)
+    cache.close()
+
+
+def test_error_responses_are_not_cached(tmp_path):
+    responses = iter([{"error": "Your account has run out of searches."}, {"organic_results": []}])
+    cache = SerpCache(str(tmp_path / "serp_cache.db"), backend=lambda params: next(responses))
+
+    assert "error" in cache.search(PARAMS)
+    assert cache.search(PARAMS) == {"organic_results": []}
+    assert cache.stats()["errors"] == 1
+    cache.close()